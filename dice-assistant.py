@@ -18,13 +18,14 @@ try:
     
     # New flow steps (3-5)
     from dice_assistant.dice_step_3_catalog_jobs import step_3_catalog_jobs
-    from dice_assistant.dice_step_4_apply_to_job_index import step_4_apply_to_job_index
+    from dice_assistant.dice_step_4_apply_to_job_index import step_4_apply_to_job_index, step_4_apply_to_jobs_parallel
     from dice_assistant.dice_step_5_loop_return import step_5_loop_return
     
     # Existing application steps (8-10) remain unchanged
     from dice_assistant.dice_step_8 import step_8_click_next
     from dice_assistant.dice_step_9 import step_9_submit_application
     from dice_assistant.dice_step_10 import step_10_handle_confirmation_and_return
+    from dice_assistant.state import SessionState
     
     STEP_FUNCTIONS_AVAILABLE = True
     print("✅ All step modules imported successfully")
@@ -44,6 +45,11 @@ class DiceAssistant:
         self.current_job_title = None  # No default - must be provided by user
         self.current_location = None  # No default - optional from user
         
+        # Tab pool mode: open several jobs at once in background tabs instead
+        # of the serial step 4 -> step 5 loop
+        self.parallel_tabs = os.environ.get('DICE_PARALLEL_TABS', '').lower() in ('1', 'true', 'yes')
+        self.parallel_tab_count = int(os.environ.get('DICE_PARALLEL_TAB_COUNT', '4'))
+        
         print(f"✅ Dice Assistant initialized")
         if self.user_email:
             print(f"📧 User email: {self.user_email}")
@@ -251,6 +257,15 @@ class DiceAssistant:
             total_jobs = job_catalog['total_jobs']
             print(f"✅ Found {total_jobs} jobs to apply to")
             
+            # Track the results window/tabs here rather than on the driver
+            state = SessionState(
+                results_window=driver.current_window_handle,
+                results_url=filtered_results_url
+            )
+            
+            if self.parallel_tabs:
+                return self._apply_to_jobs_in_tabs(driver, total_jobs)
+            
             # Loop through all jobs
             for job_index in range(total_jobs):
                 print(f"\n📝 Processing job {job_index + 1}/{total_jobs}")
@@ -258,38 +273,15 @@ class DiceAssistant:
                 try:
                     # Step 4: Apply to job at current index
                     print(f"📋 Step 4: Applying to job at index {job_index}...")
-                    apply_result = step_4_apply_to_job_index(driver, job_index)
+                    apply_result = step_4_apply_to_job_index(driver, job_index, state)
                     
                     if apply_result and apply_result.get('success'):
                         # Successfully clicked on job, now run steps 8-10
                         print("✅ Successfully selected job, proceeding with application...")
-                        
-                        # Step 8: Click "Apply now" button on job detail page
-                        if step_8_click_next(driver):
-                            print("✅ Step 8: Clicked Apply Now")
-                            
-                            # Step 9: Click "Next"
-                            if step_9_submit_application(driver):
-                                print("✅ Step 9: Clicked Next")
-                                
-                                # Step 10: Click "Submit" and handle confirmation
-                                result = step_10_handle_confirmation_and_return(driver)
-                                if result and result.get('submission_confirmed'):
-                                    print(f"✅ Application submitted successfully!")
-                                    applications_completed += 1
-                                    applied_jobs.append({
-                                        'title': f'Job #{job_index + 1}',
-                                        'company': 'Applied via Dice',
-                                        'job_search': self.current_job_title,
-                                        'location': self.current_location,
-                                        'index': job_index
-                                    })
-                                else:
-                                    print(f"❌ Step 10: Failed to confirm submission")
-                            else:
-                                print(f"❌ Step 9: Failed to click Next")
-                        else:
-                            print(f"❌ Step 8: Failed to click Apply Now")
+                        applied_job = self._complete_application(driver, job_index)
+                        if applied_job:
+                            applications_completed += 1
+                            applied_jobs.append(applied_job)
                     else:
                         error_msg = apply_result.get('error', 'Unknown error') if apply_result else 'No result returned'
                         print(f"❌ Step 4: Failed to select job - {error_msg}")
@@ -297,7 +289,7 @@ class DiceAssistant:
                     # Step 5: Return to filtered results for next job (if not last job)
                     if job_index < total_jobs - 1:
                         print(f"\n📋 Step 5: Returning to filtered results page...")
-                        loop_result = step_5_loop_return(driver, filtered_results_url)
+                        loop_result = step_5_loop_return(driver, filtered_results_url, state)
                         
                         if loop_result and loop_result.get('ready_for_next'):
                             print("✅ Ready for next job application")
@@ -330,6 +322,80 @@ class DiceAssistant:
             'applied_jobs': applied_jobs
         }
 
+    def _complete_application(self, driver, job_index, return_to_search=True):
+        """Run steps 8-10 on the current job detail page, returning the applied job or None"""
+        # Step 8: Click "Apply now" button on job detail page
+        if not step_8_click_next(driver):
+            print(f"❌ Step 8: Failed to click Apply Now")
+            return None
+        print("✅ Step 8: Clicked Apply Now")
+        
+        # Step 9: Click "Next"
+        if not step_9_submit_application(driver):
+            print(f"❌ Step 9: Failed to click Next")
+            return None
+        print("✅ Step 9: Clicked Next")
+        
+        # Step 10: Click "Submit" and handle confirmation
+        result = step_10_handle_confirmation_and_return(driver, return_to_search=return_to_search)
+        if not result or not result.get('submission_confirmed'):
+            print(f"❌ Step 10: Failed to confirm submission")
+            return None
+        
+        print(f"✅ Application submitted successfully!")
+        return {
+            'title': f'Job #{job_index + 1}',
+            'company': 'Applied via Dice',
+            'job_search': self.current_job_title,
+            'location': self.current_location,
+            'index': job_index
+        }
+
+    def _apply_to_jobs_in_tabs(self, driver, total_jobs):
+        """Apply to jobs using a pool of background tabs while the results page stays open"""
+        applications_completed = 0
+        applied_jobs = []
+        results_window = driver.current_window_handle
+        k = max(1, self.parallel_tab_count)
+        
+        for batch_start in range(0, total_jobs, k):
+            job_indices = list(range(batch_start, min(batch_start + k, total_jobs)))
+            print(f"\n📝 Processing jobs {job_indices[0] + 1}-{job_indices[-1] + 1}/{total_jobs} in tabs")
+            
+            # Step 4: Open this batch of jobs in background tabs
+            tab_results = step_4_apply_to_jobs_parallel(driver, job_indices, k=k)
+            
+            for tab_result in tab_results:
+                job_index = tab_result['job_index']
+                if not tab_result.get('success'):
+                    print(f"❌ Step 4: Failed to open job {job_index + 1} - {tab_result.get('error', 'Unknown error')}")
+                    continue
+                
+                try:
+                    driver.switch_to.window(tab_result['window_handle'])
+                    applied_job = self._complete_application(driver, job_index, return_to_search=False)
+                    if applied_job:
+                        applications_completed += 1
+                        applied_jobs.append(applied_job)
+                except Exception as e:
+                    print(f"❌ Error processing job {job_index}: {str(e)}")
+                finally:
+                    # Close the job tab; the results tab never navigated so step 5 is not needed
+                    try:
+                        driver.switch_to.window(tab_result['window_handle'])
+                        driver.close()
+                    except:
+                        pass
+                    driver.switch_to.window(results_window)
+        
+        print(f"\n📊 Completed {applications_completed}/{total_jobs} applications")
+        
+        return {
+            'success': applications_completed > 0,
+            'applications': applications_completed,
+            'applied_jobs': applied_jobs
+        }
+
     def run_automation(self, user_data=None, resume_data=None):
         """Main automation method with dynamic job title and location support"""
         driver = None
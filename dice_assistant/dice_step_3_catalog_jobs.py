@@ -1,6 +1,9 @@
 # dice_assistant/dice_step_3_catalog_jobs.py
 
+import os
+import json
 import time
+import traceback
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -72,12 +75,9 @@ def step_3_catalog_jobs(driver):
         
         # Log job titles for verification (first 5 only)
         print("\n[STEP 3] Job listings preview:")
-        for i, element in enumerate(job_elements[:5]):
-            try:
-                job_title = element.text.strip() if element.text else "No title"
-                print(f"  J{i}: {job_title[:60]}...")
-            except:
-                print(f"  J{i}: [Could not read title]")
+        for i, job in enumerate(job_elements[:5]):
+            job_title = job['title'] or "No title"
+            print(f"  J{i}: {job_title[:60]}...")
         
         if total_jobs > 5:
             print(f"  ... and {total_jobs - 5} more job(s)")
@@ -99,9 +99,7 @@ def step_3_catalog_jobs(driver):
     except Exception as e:
         print(f"[STEP 3 ERROR] Unexpected error: {str(e)}")
         print(f"[STEP 3 ERROR] Error type: {type(e).__name__}")
-        if hasattr(e, '__traceback__'):
-            import traceback
-            print(f"[STEP 3 ERROR] Traceback: {traceback.format_exc()}")
+        print(f"[STEP 3 ERROR] Traceback: {traceback.format_exc()}")
         
         return {
             'total_jobs': 0,
@@ -111,102 +109,124 @@ def step_3_catalog_jobs(driver):
 
 
 def _find_all_job_elements(driver):
-    """Find all unique job card elements on the page"""
+    """
+    Find all unique, visible job links on the page
+    
+    Runs a single in-page query over the Chrome DevTools Protocol instead of
+    one WebDriver round-trip per selector/element.
+    
+    Returns:
+        list: Job dicts sorted top-to-bottom
+              Format: {'href': str, 'title': str, 'x': float, 'y': float}
+    """
     
     # Job card selectors (same as used in original step 7)
+    # The generic selector matches every job link the specific ones do, so it
+    # runs first and the rest are only tried when it comes back empty
     job_card_selectors = [
-        # Primary selectors for job cards
+        # Generic job detail links
+        "a[href*='/job-detail/']",
+        # Fallback selectors for job cards
         "a.card-title-link[href*='/job-detail/']",
         "a[data-testid='job-card-title-link'][href*='/job-detail/']",
         "h3 a[href*='/job-detail/']",
         "h2 a[href*='/job-detail/']",
-        # Broader selectors if specific ones fail
         "a[class*='job-title'][href*='/job-detail/']",
         "a[class*='job-link'][href*='/job-detail/']",
         ".job-card a[href*='/job-detail/']",
-        "[data-testid*='job-card'] a[href*='/job-detail/']",
-        # Generic job detail links
-        "a[href*='/job-detail/']"
+        "[data-testid*='job-card'] a[href*='/job-detail/']"
     ]
     
-    # Collect all unique job elements
-    all_job_elements = []
-    seen_hrefs = set()
+    script = """
+        (function(selectors) {
+            for (const selector of selectors) {
+                const seen = new Set();
+                const jobs = [];
+                document.querySelectorAll(selector).forEach(function(el) {
+                    const href = el.href;
+                    if (!href || !href.includes('/job-detail/') || seen.has(href)) return;
+                    const rect = el.getBoundingClientRect();
+                    if (rect.width === 0 || rect.height === 0) return;
+                    seen.add(href);
+                    jobs.push({
+                        href: href,
+                        title: (el.innerText || '').trim(),
+                        x: rect.left + window.scrollX,
+                        y: rect.top + window.scrollY
+                    });
+                });
+                // Stop at the first selector that found jobs
+                if (jobs.length) return jobs;
+            }
+            return [];
+        })(%s)
+    """ % json.dumps(job_card_selectors)
     
-    for selector in job_card_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            for element in elements:
-                try:
-                    # Only include visible elements with valid hrefs
-                    if element.is_displayed():
-                        href = element.get_attribute('href')
-                        if href and '/job-detail/' in href and href not in seen_hrefs:
-                            seen_hrefs.add(href)
-                            all_job_elements.append(element)
-                except:
-                    continue
-        except Exception as e:
-            print(f"[STEP 3] Error with selector '{selector}': {str(e)}")
-            continue
+    try:
+        all_job_elements = _evaluate_js(driver, script) or []
+    except Exception as e:
+        print(f"[STEP 3] Error finding job elements: {str(e)}")
+        return []
     
     print(f"[STEP 3] Found {len(all_job_elements)} unique job elements")
     
     # Sort by position on page (top to bottom)
-    try:
-        all_job_elements.sort(key=lambda elem: (elem.location['y'], elem.location['x']))
-    except:
-        print("[STEP 3] Could not sort jobs by position")
+    all_job_elements.sort(key=lambda job: (job['y'], job['x']))
     
     return all_job_elements
 
 
+def _evaluate_js(driver, expression):
+    """Evaluate a JS expression via CDP and return its value as plain data"""
+    response = driver.execute_cdp_cmd('Runtime.evaluate', {
+        'expression': expression,
+        'returnByValue': True
+    })
+    
+    if response.get('exceptionDetails'):
+        raise Exception(response['exceptionDetails'].get('text', 'JavaScript evaluation failed'))
+    
+    return response.get('result', {}).get('value')
+
+
 def _count_already_applied_jobs(driver):
     """Count how many jobs show as already applied"""
-    applied_count = 0
+    # Card text and disabled apply buttons are checked in-page so no
+    # WebElement proxies are held for the job cards
+    script = """
+        (function() {
+            let count = 0;
+            document.querySelectorAll("[class*='job-card'], article[class*='job'], .job-listing").forEach(function(card) {
+                const cardText = (card.innerText || '').toLowerCase();
+                if (cardText.includes('applied') || cardText.includes('application submitted')) {
+                    count++;
+                    return;
+                }
+                // Check for disabled apply buttons within the card
+                const buttons = card.querySelectorAll('button[disabled]');
+                for (const button of buttons) {
+                    if ((button.innerText || '').toLowerCase().includes('apply')) {
+                        count++;
+                        return;
+                    }
+                }
+            });
+            return count;
+        })()
+    """
     
     try:
-        # Look for common "Applied" indicators
-        applied_indicators = [
-            # Text-based indicators
-            "//*[contains(text(), 'Applied')]",
-            "//*[contains(text(), 'Already Applied')]",
-            "//*[contains(text(), 'Application Submitted')]",
-            # Button/element state indicators
-            "button[disabled][class*='apply']",
-            "button[class*='applied']",
-            ".job-card[class*='applied']",
-            "[data-applied='true']"
-        ]
-        
-        # Check each job card area for applied indicators
-        job_cards = driver.find_elements(By.CSS_SELECTOR, "[class*='job-card'], article[class*='job'], .job-listing")
-        
-        for card in job_cards:
-            try:
-                card_text = card.text.lower() if card.text else ""
-                if any(term in card_text for term in ['applied', 'application submitted']):
-                    applied_count += 1
-                    continue
-                
-                # Check for disabled apply buttons within the card
-                disabled_buttons = card.find_elements(By.CSS_SELECTOR, "button[disabled]")
-                for button in disabled_buttons:
-                    button_text = button.text.lower()
-                    if 'apply' in button_text:
-                        applied_count += 1
-                        break
-            except:
-                continue
-                
+        return _evaluate_js(driver, script) or 0
     except Exception as e:
         print(f"[STEP 3] Error counting applied jobs: {str(e)}")
-    
-    return applied_count
+        return 0
 
 
 def _debug_page_state(driver):
-    """Debug helper to analyze page state"""
+    """Debug helper to analyze page state (only runs when DICE_DEBUG is set)"""
+    if not os.environ.get('DICE_DEBUG'):
+        return
+    
     try:
         print("\n[DEBUG] Page State Analysis:")
         print(f"[DEBUG] Current URL: {driver.current_url}")
@@ -1,19 +1,40 @@
 # dice_assistant/dice_step_4_apply_to_job_index.py
 
+import os
 import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
+from .logging_config import get_step_logger
 
-def step_4_apply_to_job_index(driver, job_index):
+logger = get_step_logger(__name__)
+
+# The generic job-detail selector matches every link the more specific
+# card selectors do, so it is the only one needed
+_JOB_CARD_SELECTORS = (
+    "a[href*='/job-detail/']",
+)
+_JOB_CARD_SELECTOR_COMBINED = ", ".join(_JOB_CARD_SELECTORS)
+
+_APPLIED_INDICATORS = (
+    'applied',
+    'already applied',
+    'application submitted',
+    'you applied',
+    'application sent'
+)
+
+
+def step_4_apply_to_job_index(driver, job_index, state=None):
     """
     Step 4: Click on job card at specified index from search results to navigate to job detail page
     
     Args:
         driver: Selenium WebDriver instance
         job_index: Zero-based index of which job to click (0 = first job, 1 = second job, etc.)
+        state: Optional SessionState; job tabs opened by the click are recorded on it
         
     Returns:
         dict: Result of the operation
@@ -25,30 +46,33 @@ def step_4_apply_to_job_index(driver, job_index):
               }
     """
     try:
-        print("\n" + "="*60)
-        print(f"STEP 4: Clicking on job at index {job_index}")
-        print("="*60)
+        logger.info("\n%s\nSTEP 4: Clicking on job at index %s\n%s", "="*60, job_index, "="*60)
         
         # Store the original window handle
         original_window = driver.current_window_handle
         original_windows = driver.window_handles
         current_url = driver.current_url
         
-        print(f"[STEP 4] Current URL: {current_url}")
-        print(f"[STEP 4] Target job index: {job_index}")
-        print(f"[STEP 4] Original window handle: {original_window}")
-        print(f"[STEP 4] Number of windows before click: {len(original_windows)}")
+        logger.info("[STEP 4] Current URL: %s", current_url)
+        logger.info("[STEP 4] Target job index: %s", job_index)
+        logger.debug("[STEP 4] Original window handle: %s", original_window)
+        logger.debug("[STEP 4] Number of windows before click: %s", len(original_windows))
         
-        # Wait for page to be stable
-        time.sleep(2)
+        # Wait for job links to be present
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _JOB_CARD_SELECTOR_COMBINED))
+            )
+        except TimeoutException:
+            logger.warning("[STEP 4] Timeout waiting for job links")
         
         # Find all job elements (using same logic as catalog step)
-        print("[STEP 4] Finding all job elements...")
+        logger.debug("[STEP 4] Finding all job elements...")
         job_elements = _find_all_job_elements(driver)
         
         if not job_elements:
             error_msg = "No job elements found on page"
-            print(f"[STEP 4] ERROR: {error_msg}")
+            logger.error("[STEP 4] ERROR: %s", error_msg)
             return {
                 'success': False,
                 'job_index': job_index,
@@ -58,38 +82,49 @@ def step_4_apply_to_job_index(driver, job_index):
         # Check if requested index exists
         if job_index >= len(job_elements):
             error_msg = f"Requested index {job_index} but only {len(job_elements)} jobs available"
-            print(f"[STEP 4] ERROR: {error_msg}")
+            logger.error("[STEP 4] ERROR: %s", error_msg)
             return {
                 'success': False,
                 'job_index': job_index,
                 'error': error_msg
             }
         
-        # Get the target job element
-        target_element = job_elements[job_index]
+        target_job = job_elements[job_index]
         
         # Check if this job might already be applied to
-        if _check_if_already_applied(driver, target_element, job_index):
+        if target_job['alreadyApplied']:
             error_msg = f"Job at index {job_index} appears to be already applied to"
-            print(f"[STEP 4] WARNING: {error_msg}")
+            logger.warning("[STEP 4] WARNING: %s", error_msg)
             return {
                 'success': False,
                 'job_index': job_index,
                 'error': error_msg
             }
         
-        # Get job info before clicking
-        try:
-            job_text = target_element.text.strip() if target_element.text else "No title"
-            href = target_element.get_attribute('href')
-            print(f"[STEP 4] Target job: {job_text[:60]}...")
-            print(f"[STEP 4] Job URL: {href[:80]}...")
-        except:
-            job_text = "Unknown"
-            href = "Unknown"
+        # Resolve a live element only for the job we are about to click
+        target_element = _resolve_job_element(driver, target_job['href'])
+        
+        if target_element is None:
+            error_msg = f"Job element at index {job_index} is no longer on the page"
+            logger.error("[STEP 4] ERROR: %s", error_msg)
+            return {
+                'success': False,
+                'job_index': job_index,
+                'error': error_msg
+            }
+        
+        # Job info was already collected during discovery
+        job_text = target_job['text'] or "No title"
+        href = target_job['href']
+        logger.info("[STEP 4] Target job: %s...", job_text[:60])
+        logger.info("[STEP 4] Job URL: %s...", href[:80])
         
         # Attempt to click the job
-        click_success = _click_job_element(driver, target_element, job_index)
+        click_success = _click_job_element(
+            driver, target_element, job_index,
+            starting_url=current_url,
+            starting_handles=len(original_windows)
+        )
         
         if not click_success:
             return {
@@ -98,17 +133,22 @@ def step_4_apply_to_job_index(driver, job_index):
                 'error': 'Failed to click job element'
             }
         
-        # Wait for navigation
-        print("[STEP 4] Waiting for page navigation...")
-        time.sleep(4)
+        # Wait for navigation (new tab or URL change)
+        logger.debug("[STEP 4] Waiting for page navigation...")
+        try:
+            WebDriverWait(driver, 10).until(
+                lambda d: len(d.window_handles) > len(original_windows) or d.current_url != current_url
+            )
+        except TimeoutException:
+            logger.warning("[STEP 4] Timeout waiting for navigation")
         
         # Check if a new window/tab was opened
         new_windows = driver.window_handles
-        print(f"[STEP 4] Number of windows after click: {len(new_windows)}")
+        logger.debug("[STEP 4] Number of windows after click: %s", len(new_windows))
         
         # Handle new tab scenario
         if len(new_windows) > len(original_windows):
-            print("[STEP 4] New tab detected, switching to it...")
+            logger.info("[STEP 4] New tab detected, switching to it...")
             
             # Find the new window handle
             new_window = None
@@ -120,19 +160,23 @@ def step_4_apply_to_job_index(driver, job_index):
             if new_window:
                 # Switch to the new tab
                 driver.switch_to.window(new_window)
-                print(f"[STEP 4] Switched to new tab: {new_window}")
+                logger.debug("[STEP 4] Switched to new tab: %s", new_window)
                 
                 # Wait for the new page to load
-                time.sleep(2)
+                try:
+                    WebDriverWait(driver, 10).until(EC.url_contains('/job-detail/'))
+                except TimeoutException:
+                    pass
                 
                 # Verify we're on a job detail page
                 new_url = driver.current_url
                 if '/job-detail/' in new_url:
-                    print(f"[STEP 4] SUCCESS: Navigated to job detail page in new tab")
-                    print(f"[STEP 4] Job detail URL: {new_url}")
+                    logger.info("[STEP 4] SUCCESS: Navigated to job detail page in new tab")
+                    logger.info("[STEP 4] Job detail URL: %s", new_url)
                     
-                    # Store the original window handle for later use
-                    driver.original_window = original_window
+                    # Record the job tab so step 5 can close it
+                    if state is not None:
+                        state.job_tabs.append(new_window)
                     
                     return {
                         'success': True,
@@ -140,7 +184,7 @@ def step_4_apply_to_job_index(driver, job_index):
                         'job_url': new_url
                     }
                 else:
-                    print(f"[STEP 4] New tab opened but not on job detail page: {new_url}")
+                    logger.warning("[STEP 4] New tab opened but not on job detail page: %s", new_url)
                     # Switch back to original window
                     driver.switch_to.window(original_window)
                     return {
@@ -153,8 +197,8 @@ def step_4_apply_to_job_index(driver, job_index):
         else:
             new_url = driver.current_url
             if new_url != current_url and '/job-detail/' in new_url:
-                print(f"[STEP 4] SUCCESS: Navigated to job detail page in same window")
-                print(f"[STEP 4] Job detail URL: {new_url}")
+                logger.info("[STEP 4] SUCCESS: Navigated to job detail page in same window")
+                logger.info("[STEP 4] Job detail URL: %s", new_url)
                 
                 return {
                     'success': True,
@@ -162,8 +206,8 @@ def step_4_apply_to_job_index(driver, job_index):
                     'job_url': new_url
                 }
             elif new_url != current_url:
-                print(f"[STEP 4] Page changed but not to expected job detail format")
-                print(f"[STEP 4] New URL: {new_url}")
+                logger.warning("[STEP 4] Page changed but not to expected job detail format")
+                logger.warning("[STEP 4] New URL: %s", new_url)
                 # Still consider it potential success
                 return {
                     'success': True,
@@ -172,7 +216,7 @@ def step_4_apply_to_job_index(driver, job_index):
                 }
             else:
                 error_msg = "Failed to navigate - URL unchanged"
-                print(f"[STEP 4] ERROR: {error_msg}")
+                logger.error("[STEP 4] ERROR: %s", error_msg)
                 return {
                     'success': False,
                     'job_index': job_index,
@@ -181,11 +225,7 @@ def step_4_apply_to_job_index(driver, job_index):
                 
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        print(f"[STEP 4 ERROR] {error_msg}")
-        print(f"[STEP 4 ERROR] Error type: {type(e).__name__}")
-        if hasattr(e, '__traceback__'):
-            import traceback
-            print(f"[STEP 4 ERROR] Traceback: {traceback.format_exc()}")
+        logger.exception("[STEP 4 ERROR] %s (%s)", error_msg, type(e).__name__)
         
         return {
             'success': False,
@@ -194,113 +234,214 @@ def step_4_apply_to_job_index(driver, job_index):
         }
 
 
-def _find_all_job_elements(driver):
-    """Find all unique job card elements on the page - same as catalog step"""
-    
-    job_card_selectors = [
-        # Primary selectors for job cards
-        "a.card-title-link[href*='/job-detail/']",
-        "a[data-testid='job-card-title-link'][href*='/job-detail/']",
-        "h3 a[href*='/job-detail/']",
-        "h2 a[href*='/job-detail/']",
-        # Broader selectors if specific ones fail
-        "a[class*='job-title'][href*='/job-detail/']",
-        "a[class*='job-link'][href*='/job-detail/']",
-        ".job-card a[href*='/job-detail/']",
-        "[data-testid*='job-card'] a[href*='/job-detail/']",
-        # Generic job detail links
-        "a[href*='/job-detail/']"
-    ]
+def step_4_apply_to_jobs_parallel(driver, job_indices, k=4):
+    """
+    Step 4 (tab pool): Open up to k jobs from the results page in background tabs
     
-    # Collect all unique job elements
-    all_job_elements = []
-    seen_hrefs = set()
+    Each job is opened with a CDP Target.createTarget call so the browser loads
+    all of them concurrently while the results page stays untouched in its own
+    tab. The caller then switches into each tab to run the application steps,
+    closes it, and switches back to the results tab - no step 5 navigation is
+    needed between jobs.
     
-    for selector in job_card_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            for element in elements:
-                try:
-                    if element.is_displayed():
-                        href = element.get_attribute('href')
-                        if href and '/job-detail/' in href and href not in seen_hrefs:
-                            seen_hrefs.add(href)
-                            all_job_elements.append(element)
-                except:
-                    continue
-        except:
-            continue
-    
-    # Sort by position on page (top to bottom)
-    try:
-        all_job_elements.sort(key=lambda elem: (elem.location['y'], elem.location['x']))
-    except:
-        pass
+    Args:
+        driver: Selenium WebDriver instance (Chrome)
+        job_indices: Zero-based indices of the jobs to open (only the first k are used)
+        k: Maximum number of tabs to open at once
+        
+    Returns:
+        list: One result per requested index, in order
+              Format: {
+                  'success': bool,
+                  'job_index': int,
+                  'error': str (if failed),
+                  'job_url': str (if successful),
+                  'window_handle': str (if successful)
+              }
+    """
+    results = []
     
-    return all_job_elements
-
-
-def _check_if_already_applied(driver, job_element, job_index):
-    """Check if a job has already been applied to"""
     try:
-        # Get the parent job card container
-        job_card = job_element
-        for _ in range(3):  # Go up to 3 levels to find job card container
-            try:
-                parent = job_card.find_element(By.XPATH, "./..")
-                if any(cls in parent.get_attribute('class') or '' for cls in ['job-card', 'job-listing', 'job-item']):
-                    job_card = parent
-                    break
-            except:
-                break
+        logger.info("\n%s\nSTEP 4: Opening up to %s jobs in parallel tabs\n%s", "="*60, k, "="*60)
         
-        # Check for "Applied" indicators in the job card
-        job_card_text = job_card.text.lower() if job_card.text else ""
+        # Wait for job links to be present
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _JOB_CARD_SELECTOR_COMBINED))
+            )
+        except TimeoutException:
+            logger.warning("[STEP 4] Timeout waiting for job links")
         
-        applied_indicators = [
-            'applied',
-            'already applied',
-            'application submitted',
-            'you applied',
-            'application sent'
-        ]
+        job_elements = _find_all_job_elements(driver)
+        original_windows = set(driver.window_handles)
         
-        for indicator in applied_indicators:
-            if indicator in job_card_text:
-                print(f"[STEP 4] Found '{indicator}' indicator in job card")
-                return True
+        opened = []
+        for job_index in list(job_indices)[:k]:
+            if job_index >= len(job_elements):
+                error_msg = f"Requested index {job_index} but only {len(job_elements)} jobs available"
+                logger.error("[STEP 4] ERROR: %s", error_msg)
+                results.append({'success': False, 'job_index': job_index, 'error': error_msg})
+                continue
+            
+            job = job_elements[job_index]
+            if job['alreadyApplied']:
+                error_msg = f"Job at index {job_index} appears to be already applied to"
+                logger.warning("[STEP 4] WARNING: %s", error_msg)
+                results.append({'success': False, 'job_index': job_index, 'error': error_msg})
+                continue
+            
+            target = driver.execute_cdp_cmd("Target.createTarget", {
+                "url": job['href'],
+                "newWindow": False,
+                "background": True
+            })
+            logger.info("[STEP 4] Opened J%s in background tab: %s...", job_index, job['text'][:60])
+            result = {'success': True, 'job_index': job_index, 'job_url': job['href']}
+            results.append(result)
+            opened.append((result, target.get('targetId')))
         
-        # Check for disabled apply buttons
-        try:
-            apply_buttons = job_card.find_elements(By.XPATH, ".//button[contains(text(), 'Apply') or contains(text(), 'Applied')]")
-            for button in apply_buttons:
-                if button.get_attribute('disabled') or 'applied' in button.text.lower():
-                    print(f"[STEP 4] Found disabled/applied button in job card")
-                    return True
-        except:
-            pass
+        # ChromeDriver uses the CDP target id as the window handle; fall back
+        # to the newly appeared handles if that ever stops being true
+        window_handles = driver.window_handles
+        new_handles = [h for h in window_handles if h not in original_windows]
+        for i, (result, target_id) in enumerate(opened):
+            if target_id in window_handles:
+                result['window_handle'] = target_id
+            elif i < len(new_handles):
+                result['window_handle'] = new_handles[i]
+            else:
+                result['success'] = False
+                result['error'] = 'Could not locate the tab opened for this job'
         
-        return False
+        logger.info("[STEP 4] Opened %s job tab(s)", len(opened))
+        return results
         
     except Exception as e:
-        print(f"[STEP 4] Error checking if already applied: {str(e)}")
-        return False
+        error_msg = f"Unexpected error: {str(e)}"
+        logger.exception("[STEP 4 ERROR] %s", error_msg)
+        
+        # Report every index that did not get a tab
+        reported = {r['job_index'] for r in results}
+        for job_index in list(job_indices)[:k]:
+            if job_index not in reported:
+                results.append({'success': False, 'job_index': job_index, 'error': error_msg})
+        return results
 
 
-def _click_job_element(driver, element, job_index):
-    """Attempt to click the job element using multiple strategies"""
+def _find_all_job_elements(driver):
+    """
+    Find all unique job cards on the page - same as catalog step
+    
+    Discovery, visibility, de-duplication, "already applied" detection and
+    sorting all happen in a single execute_script call. Returns plain dicts
+    (href, x, y, text, alreadyApplied) so no WebElement is held until the
+    caller resolves the one it clicks.
+    """
+    
     try:
-        # Scroll element into view
+        return driver.execute_script("""
+            const selector = arguments[0];
+            const appliedIndicators = arguments[1];
+            
+            function findCard(el) {
+                // Nearest job card container, or the link itself
+                return el.closest('.job-card, .job-listing, .job-item, [data-testid*="job-card"]') || el;
+            }
+            
+            function isAlreadyApplied(card) {
+                // Check for "Applied" indicators in the job card
+                const cardText = (card.innerText || '').toLowerCase();
+                if (appliedIndicators.some(function(ind) { return cardText.includes(ind); })) {
+                    return true;
+                }
+                // Check for disabled/applied apply buttons
+                return Array.from(card.querySelectorAll('button')).some(function(button) {
+                    const text = button.innerText || '';
+                    if (!text.includes('Apply') && !text.includes('Applied')) return false;
+                    return button.disabled || text.toLowerCase().includes('applied');
+                });
+            }
+            
+            const seen = new Set();
+            const jobs = [];
+            document.querySelectorAll(selector).forEach(function(el) {
+                const href = el.href;
+                if (!href || !href.includes('/job-detail/') || seen.has(href)) return;
+                const rect = el.getBoundingClientRect();
+                if (rect.width === 0 || rect.height === 0) return;
+                seen.add(href);
+                jobs.push({
+                    href: href,
+                    x: rect.left + window.scrollX,
+                    y: rect.top + window.scrollY,
+                    text: (el.innerText || '').trim().slice(0, 120),
+                    alreadyApplied: isAlreadyApplied(findCard(el))
+                });
+            });
+            // Sort by position on page (top to bottom)
+            jobs.sort(function(a, b) { return a.y - b.y || a.x - b.x; });
+            return jobs;
+        """, _JOB_CARD_SELECTOR_COMBINED, _APPLIED_INDICATORS) or []
+    except Exception as e:
+        logger.error("[STEP 4] Error finding job elements: %s", e)
+        return []
+
+
+def _resolve_job_element(driver, href):
+    """Resolve the live anchor element for a job href found by _find_all_job_elements"""
+    # Match on the resolved .href so relative and absolute links both work
+    return driver.execute_script("""
+        const href = arguments[0];
+        return Array.from(document.querySelectorAll(arguments[1]))
+            .find(function(el) { return el.href === href; }) || null;
+    """, href, _JOB_CARD_SELECTOR_COMBINED)
+
+
+def _click_job_element(driver, element, job_index, starting_url=None, starting_handles=None):
+    """
+    Attempt to click the job element using multiple strategies
+    
+    starting_url/starting_handles let the caller pass in values it already
+    fetched so they are not read from the browser again.
+    """
+    try:
+        # Job links are plain anchors - navigating straight to the href is
+        # faster and deterministic, so the click strategies are only needed
+        # for non-anchor elements
+        info = driver.execute_script(
+            "return {tag: arguments[0].tagName, href: arguments[0].href || ''};", element
+        )
+        href = info['href']
+        if info['tag'].lower() == 'a' and href.startswith('http'):
+            logger.debug("[STEP 4] Navigating directly to job link")
+            driver.get(href)
+            return True
+        
+        if starting_url is None:
+            starting_url = driver.current_url
+        if starting_handles is None:
+            starting_handles = len(driver.window_handles)
+        
+        # Scroll element into view and wait until it is actually in the viewport
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-        time.sleep(1)
+        try:
+            WebDriverWait(driver, 3).until(
+                lambda d: d.execute_script(
+                    "const r = arguments[0].getBoundingClientRect(); return r.top >= 0 && r.bottom <= window.innerHeight;",
+                    element
+                )
+            )
+        except TimeoutException:
+            logger.debug("[STEP 4] Element not fully in viewport, clicking anyway")
         
         # Highlight the element briefly for debugging
-        try:
-            driver.execute_script("arguments[0].style.border='3px solid green'", element)
-            time.sleep(0.5)
-            driver.execute_script("arguments[0].style.border=''", element)
-        except:
-            pass
+        if os.environ.get('INCODEV_DEBUG_HIGHLIGHT'):
+            try:
+                driver.execute_script("arguments[0].style.border='3px solid green'", element)
+                time.sleep(0.5)
+                driver.execute_script("arguments[0].style.border=''", element)
+            except:
+                pass
         
         # Try multiple click strategies
         click_strategies = [
@@ -316,24 +457,29 @@ def _click_job_element(driver, element, job_index):
         
         for i, strategy in enumerate(click_strategies):
             try:
-                print(f"[STEP 4] Trying click strategy {i+1}...")
+                logger.debug("[STEP 4] Trying click strategy %s...", i + 1)
                 strategy()
-                print(f"[STEP 4] Click strategy {i+1} executed")
-                time.sleep(1)  # Brief pause to see if navigation starts
+                logger.debug("[STEP 4] Click strategy %s executed", i + 1)
                 
-                # Check if URL changed (quick success check)
-                if driver.current_url != element.get_attribute('href'):
+                # Brief wait to see if navigation starts (URL change or new tab)
+                try:
+                    WebDriverWait(driver, 2).until(
+                        lambda d: d.current_url != starting_url or len(d.window_handles) > starting_handles
+                    )
                     return True
+                except TimeoutException:
+                    logger.debug("[STEP 4] No navigation after click strategy %s", i + 1)
                     
             except Exception as e:
-                print(f"[STEP 4] Click strategy {i+1} failed: {str(e)}")
+                logger.debug("[STEP 4] Click strategy %s failed: %s", i + 1, e)
                 continue
         
-        # If we get here, assume the last strategy worked
-        return True
+        # No strategy produced a navigation - report it rather than guess
+        logger.warning("[STEP 4] No click strategy navigated away from the results page")
+        return False
         
     except Exception as e:
-        print(f"[STEP 4] Error clicking job element: {str(e)}")
+        logger.error("[STEP 4] Error clicking job element: %s", e)
         return False
 
 
@@ -345,6 +491,9 @@ def _click_with_action_chains(driver, element):
 
 
 def _click_parent_element(driver, element):
-    """Try clicking the parent element"""
-    parent = element.find_element(By.XPATH, "./..")
-    driver.execute_script("arguments[0].click();", parent)
\ No newline at end of file
+    """Try clicking the job card container (or direct parent) in one JS call"""
+    driver.execute_script("""
+        const el = arguments[0];
+        const card = el.parentElement && el.parentElement.closest('.job-card, .job-listing, .job-item');
+        (card || el.parentElement).click();
+    """, element)
\ No newline at end of file
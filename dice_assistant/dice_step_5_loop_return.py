@@ -2,16 +2,19 @@
 
 import time
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 
-def step_5_loop_return(driver, filtered_results_url):
+def step_5_loop_return(driver, filtered_results_url, state=None):
     """
     Step 5: Return to the filtered job results page to process the next job
     
     Args:
         driver: Selenium WebDriver instance
         filtered_results_url: The URL of the filtered search results to return to
+        state: Optional SessionState holding the results window and open job tabs
         
     Returns:
         dict: Result of the operation
@@ -38,52 +41,68 @@ def step_5_loop_return(driver, filtered_results_url):
         if len(current_windows) > 1:
             print("[STEP 5] Multiple windows detected, handling tabs...")
             
-            # Check if we have stored the original window
-            if hasattr(driver, 'original_window'):
-                print(f"[STEP 5] Original window handle found: {driver.original_window}")
+            # Check if we know the results window (and it is still open)
+            if state is not None and state.results_window in current_windows:
+                print(f"[STEP 5] Results window handle found: {state.results_window}")
                 
-                # Close current tab if it's not the original
+                # Close current tab if it's not the results window
                 current_window = driver.current_window_handle
-                if current_window != driver.original_window:
+                if current_window != state.results_window:
                     print("[STEP 5] Closing current tab...")
                     driver.close()
-                    time.sleep(0.5)
+                    if current_window in state.job_tabs:
+                        state.job_tabs.remove(current_window)
                 
-                # Switch back to original window
-                print("[STEP 5] Switching to original window...")
-                driver.switch_to.window(driver.original_window)
-                time.sleep(1)
+                # Switch back to results window
+                print("[STEP 5] Switching to results window...")
+                driver.switch_to.window(state.results_window)
+                current_url = driver.current_url
             else:
                 # No original window stored, try to find the right one
-                print("[STEP 5] No original window stored, attempting to find results window...")
+                print("[STEP 5] No results window stored, attempting to find results window...")
+                
+                # One CDP call lists every tab's URL without switching windows
+                # (ChromeDriver window handles are the CDP target ids)
+                targets = driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+                pages = [t for t in targets if t.get('type') == 'page' and t['targetId'] in current_windows]
+                results_target = next((t for t in pages if filtered_results_url in t.get('url', '')), None)
                 
-                # Try each window to find the one with the results
-                for window in current_windows:
-                    driver.switch_to.window(window)
-                    if filtered_results_url in driver.current_url:
-                        print(f"[STEP 5] Found results window: {window}")
-                        # Close other windows
-                        for other_window in current_windows:
-                            if other_window != window:
-                                driver.switch_to.window(other_window)
-                                driver.close()
-                        driver.switch_to.window(window)
-                        break
+                if results_target:
+                    print(f"[STEP 5] Found results window: {results_target['targetId']}")
+                    # Close other windows
+                    for target in pages:
+                        if target['targetId'] != results_target['targetId']:
+                            driver.execute_cdp_cmd("Target.closeTarget", {"targetId": target['targetId']})
+                    driver.switch_to.window(results_target['targetId'])
+                    current_url = results_target['url']
+        
+        # Fast path: no navigation needed and job links are already on the page
+        if current_url == filtered_results_url and driver.find_elements(By.CSS_SELECTOR, "a[href*='/job-detail/']"):
+            print("[STEP 5] Already on filtered results page with job links - ready for next job")
+            return {
+                'ready_for_next': True,
+                'current_url': filtered_results_url
+            }
         
         # Navigate to filtered results URL
         print("[STEP 5] Navigating to filtered results...")
         
         # Check if we're already on the results page
-        if driver.current_url == filtered_results_url:
+        if current_url == filtered_results_url:
             print("[STEP 5] Already on filtered results page")
         else:
             # Navigate to the filtered results
             driver.get(filtered_results_url)
             print("[STEP 5] Navigated to filtered results URL")
         
-        # Wait for page to load
-        print("[STEP 5] Waiting for page to stabilize...")
-        time.sleep(4)
+        # Wait for job links to load
+        print("[STEP 5] Waiting for job listings...")
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/job-detail/']"))
+            )
+        except TimeoutException:
+            print("[STEP 5] Timeout waiting for job listings")
         
         # Verify we're on the job search results page
         if _verify_on_results_page(driver):
@@ -110,10 +129,23 @@ def step_5_loop_return(driver, filtered_results_url):
             error_msg = "Failed to verify return to results page"
             print(f"[STEP 5] ERROR: {error_msg}")
             
-            # Try one more direct navigation
-            print("[STEP 5] Attempting direct navigation retry...")
-            driver.get(filtered_results_url)
-            time.sleep(3)
+            # Only reload if the URL actually drifted - reloading the same
+            # page can't fix a selector/verification issue
+            if driver.current_url != filtered_results_url:
+                print("[STEP 5] URL drifted, navigating back to filtered results...")
+                driver.get(filtered_results_url)
+            
+            # Clear anything covering the results and verify once more
+            _handle_popups(driver)
+            try:
+                WebDriverWait(driver, 5).until(_verify_on_results_page)
+                print("[STEP 5] Results page verified on retry")
+                return {
+                    'ready_for_next': True,
+                    'current_url': driver.current_url
+                }
+            except TimeoutException:
+                print("[STEP 5] Results page still not verified")
             
             return {
                 'ready_for_next': True,  # Continue anyway to avoid getting stuck
@@ -190,34 +222,34 @@ def _verify_on_results_page(driver):
 def _verify_ready_for_next_job(driver):
     """Verify the page is ready to click on the next job"""
     try:
+        # Ready state, visible loading spinners and job links in one round-trip
+        page_state = driver.execute_script("""
+            const loaders = Array.from(document.querySelectorAll(
+                "[class*='loading'], [class*='spinner'], .loader, [data-testid='loading']"
+            )).filter(function(el) {
+                const rect = el.getBoundingClientRect();
+                return rect.width > 0 && rect.height > 0;
+            });
+            return {
+                readyState: document.readyState,
+                visibleLoaders: loaders.length,
+                jobLinks: document.querySelectorAll("a[href*='/job-detail/']").length
+            };
+        """)
+        
         # Check that page is not loading
-        ready_state = driver.execute_script("return document.readyState")
-        if ready_state != "complete":
-            print(f"[STEP 5] Page not fully loaded, state: {ready_state}")
+        if page_state['readyState'] != "complete":
+            print(f"[STEP 5] Page not fully loaded, state: {page_state['readyState']}")
             return False
         
         # Check for loading spinners
-        loading_indicators = [
-            "[class*='loading']",
-            "[class*='spinner']",
-            ".loader",
-            "[data-testid='loading']"
-        ]
-        
-        for indicator in loading_indicators:
-            try:
-                loaders = driver.find_elements(By.CSS_SELECTOR, indicator)
-                visible_loaders = [l for l in loaders if l.is_displayed()]
-                if visible_loaders:
-                    print(f"[STEP 5] Found {len(visible_loaders)} visible loading indicators")
-                    return False
-            except:
-                continue
+        if page_state['visibleLoaders']:
+            print(f"[STEP 5] Found {page_state['visibleLoaders']} visible loading indicators")
+            return False
         
         # Check that job elements are present and clickable
-        job_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/job-detail/']")
-        if job_links:
-            print(f"[STEP 5] Found {len(job_links)} job links on page")
+        if page_state['jobLinks']:
+            print(f"[STEP 5] Found {page_state['jobLinks']} job links on page")
             return True
         else:
             print("[STEP 5] No job links found yet")
@@ -231,38 +263,27 @@ def _verify_ready_for_next_job(driver):
 def _handle_popups(driver):
     """Handle any popups or modals that might interfere with clicking jobs"""
     try:
-        # Common popup close button selectors
-        popup_close_selectors = [
-            "button[aria-label='Close']",
-            "button[class*='close']",
-            ".modal button[class*='close']",
-            "[data-dismiss='modal']",
-            "button:contains('×')",
-            "button:contains('X')",
-            "[class*='popup'] button[class*='close']"
+        # All common popup close buttons in one query, including the
+        # text-based "×" / "X" buttons that CSS cannot express
+        popup_close_xpath = (
+            "//button[@aria-label='Close' or contains(@class, 'close') or @data-dismiss='modal'"
+            " or contains(text(), '×') or normalize-space(text())='X']"
+            " | //*[@data-dismiss='modal']"
+        )
+        
+        close_buttons = [
+            button for button in driver.find_elements(By.XPATH, popup_close_xpath)
+            if button.is_displayed() and button.is_enabled()
         ]
         
-        for selector in popup_close_selectors:
+        for button in close_buttons:
+            print(f"[STEP 5] Found popup close button, clicking...")
             try:
-                # Handle CSS selectors
-                if ':contains' not in selector:
-                    close_buttons = driver.find_elements(By.CSS_SELECTOR, selector)
-                else:
-                    # Handle text-based selectors
-                    button_text = selector.split("'")[1]
-                    close_buttons = driver.find_elements(By.XPATH, f"//button[contains(text(), '{button_text}')]")
-                
-                for button in close_buttons:
-                    if button.is_displayed() and button.is_enabled():
-                        print(f"[STEP 5] Found popup close button, clicking...")
-                        try:
-                            driver.execute_script("arguments[0].click();", button)
-                            time.sleep(1)
-                            print("[STEP 5] Popup closed")
-                        except:
-                            pass
+                driver.execute_script("arguments[0].click();", button)
+                time.sleep(1)
+                print("[STEP 5] Popup closed")
             except:
-                continue
+                pass
                 
     except Exception as e:
         print(f"[STEP 5] Error handling popups: {str(e)}")
@@ -282,8 +303,11 @@ def _debug_page_state(driver):
         print(f"[DEBUG] Total job links: {len(job_links)}")
         print(f"[DEBUG] Visible job links: {len(visible_jobs)}")
         
-        # Check page text for indicators
-        page_text = driver.page_source[:500].lower()
+        # Check page text for indicators (only the first 500 chars are read,
+        # so don't transfer the whole page source)
+        page_text = driver.execute_script(
+            "return document.body ? document.body.innerText.slice(0, 500).toLowerCase() : '';"
+        ) or ''
         if 'no results' in page_text or '0 jobs' in page_text:
             print("[DEBUG] Page may show no results")
         
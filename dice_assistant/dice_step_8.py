@@ -1,13 +1,19 @@
 # dice_assistant/dice_step_8.py
 
-import time
 import re
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, ElementClickInterceptedException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 
+from .logging_config import get_step_logger
+from .selenium_helpers import CLICK_JS, explicit_wait
+
+logger = get_step_logger(__name__)
+
+# Job id in a job detail URL, e.g. /job-detail/3f2a-...
+_JOB_ID_RE = re.compile(r'/job-detail/([a-f0-9-]+)')
+
 def step_8_click_next(driver):
     """
     Step 8: Click 'Apply now' button on the job detail page
@@ -19,122 +25,146 @@ def step_8_click_next(driver):
         bool: True if successful, False otherwise
     """
     try:
-        print("\n" + "="*60)
-        print("STEP 8: Clicking Apply button on job detail page")
-        print("="*60)
-        
-        # Wait for page to load
-        print("[STEP 8] Waiting for page to load...")
-        time.sleep(5)
+        logger.info("\n%s\nSTEP 8: Clicking Apply button on job detail page\n%s", "="*60, "="*60)
         
-        current_url = driver.current_url
-        print(f"[STEP 8] Current URL: {current_url}")
-        
-        # Strategy 1: Find the apply-button-wc custom element
-        print("\n[STEP 8] Strategy 1: Looking for apply-button-wc custom element...")
-        apply_success = _handle_custom_apply_button(driver)
-        
-        if apply_success:
-            print("[STEP 8] SUCCESS: Apply button handled")
-            return True
+        # Wait for the apply button (custom element or container) to render
+        logger.debug("[STEP 8] Waiting for page to load...")
+        try:
+            explicit_wait(driver).until(EC.any_of(
+                EC.presence_of_element_located((By.TAG_NAME, "apply-button-wc")),
+                EC.presence_of_element_located((By.ID, "applyButton"))
+            ))
+        except TimeoutException:
+            logger.warning("[STEP 8] Timeout waiting for apply button to render")
+        
+        # One probe reports which strategies are viable, along with the
+        # apply-button-wc element and job attributes strategies 1 and 3 use
+        probe = _probe_apply_page(driver)
+        current_url = probe['url']
+        apply_element = probe['wc']
+        job_info = {'job_id': probe['jobId'], 'job_title': probe['jobTitle']} if apply_element else {}
+        logger.info("[STEP 8] Current URL: %s", current_url)
+        
+        # Strategy 1: Find the apply-button-wc custom element (skipped when
+        # it isn't on the page, rather than waiting for it to time out)
+        if apply_element is not None:
+            logger.debug("\n[STEP 8] Strategy 1: Looking for apply-button-wc custom element...")
+            apply_success = _handle_custom_apply_button(driver, apply_element, job_info)
+            
+            if apply_success:
+                logger.info("[STEP 8] SUCCESS: Apply button handled")
+                return True
+        else:
+            logger.debug("\n[STEP 8] Strategy 1 skipped: no apply-button-wc element on page")
         
         # Strategy 2: Look inside the applyButton div
-        print("\n[STEP 8] Strategy 2: Looking inside applyButton div...")
-        apply_button = _find_apply_button_in_container(driver)
-        
-        if apply_button:
-            success = _click_element_safely(driver, apply_button)
-            if success:
-                print("[STEP 8] SUCCESS: Apply button clicked")
-                return True
+        if probe['hasDiv']:
+            logger.debug("\n[STEP 8] Strategy 2: Looking inside applyButton div...")
+            apply_button = _find_apply_button_in_container(driver)
+            
+            if apply_button:
+                success = _click_element_safely(driver, apply_button)
+                if success:
+                    logger.info("[STEP 8] SUCCESS: Apply button clicked")
+                    return True
+        else:
+            logger.debug("\n[STEP 8] Strategy 2 skipped: no applyButton div on page")
         
         # Strategy 3: Extract URL from job-id and navigate directly
-        print("\n[STEP 8] Strategy 3: Extracting job ID and constructing apply URL...")
-        apply_url = _extract_and_construct_apply_url(driver)
+        logger.debug("\n[STEP 8] Strategy 3: Extracting job ID and constructing apply URL...")
+        apply_url = _extract_and_construct_apply_url(driver, job_info)
         
         if apply_url:
-            print(f"[STEP 8] Navigating to apply URL: {apply_url}")
+            logger.info("[STEP 8] Navigating to apply URL: %s", apply_url)
             driver.get(apply_url)
-            time.sleep(3)
+            try:
+                explicit_wait(driver).until(EC.url_changes(current_url))
+            except TimeoutException:
+                pass
             
             new_url = driver.current_url
             if new_url != current_url:
-                print("[STEP 8] SUCCESS: Navigated to application page")
+                logger.info("[STEP 8] SUCCESS: Navigated to application page")
                 return True
         
-        print("[STEP 8] ERROR: Could not handle Apply button")
+        logger.error("[STEP 8] ERROR: Could not handle Apply button")
         return False
         
     except Exception as e:
-        print(f"[STEP 8 ERROR] Unexpected error: {str(e)}")
-        print(f"[STEP 8 ERROR] Error type: {type(e).__name__}")
-        if hasattr(e, '__traceback__'):
-            import traceback
-            print(f"[STEP 8 ERROR] Traceback: {traceback.format_exc()}")
+        logger.exception("[STEP 8 ERROR] Unexpected error: %s (%s)", e, type(e).__name__)
         return False
 
-def _handle_custom_apply_button(driver):
+def _probe_apply_page(driver):
+    """Report the apply-button-wc element, its job attributes, the applyButton div and the URL"""
+    return driver.execute_script("""
+        const wc = document.querySelector('apply-button-wc');
+        return {
+            wc: wc,
+            jobId: wc && wc.getAttribute('job-id'),
+            jobTitle: wc && wc.getAttribute('job-title'),
+            hasDiv: !!document.getElementById('applyButton'),
+            url: location.href
+        };
+    """)
+
+def _handle_custom_apply_button(driver, apply_element=None, job_info=None):
     """Handle the apply-button-wc custom web component"""
     try:
-        # Wait for the custom element to be present
-        wait = WebDriverWait(driver, 10)
-        apply_element = wait.until(
-            EC.presence_of_element_located((By.TAG_NAME, "apply-button-wc"))
-        )
+        if apply_element is None:
+            # Wait for the custom element to be present
+            wait = explicit_wait(driver)
+            apply_element = wait.until(
+                EC.presence_of_element_located((By.TAG_NAME, "apply-button-wc"))
+            )
         
-        print("[STEP 8] Found apply-button-wc element")
+        logger.debug("[STEP 8] Found apply-button-wc element")
         
         # Get job information from the element
-        job_id = apply_element.get_attribute('job-id')
-        job_title = apply_element.get_attribute('job-title')
-        print(f"[STEP 8] Job ID: {job_id}")
-        print(f"[STEP 8] Job Title: {job_title}")
-        
-        # Try to find button inside the custom element (might be in shadow DOM)
-        # First, try regular DOM
+        if not job_info:
+            job_info = {
+                'job_id': apply_element.get_attribute('job-id'),
+                'job_title': apply_element.get_attribute('job-title')
+            }
+        logger.info("[STEP 8] Job ID: %s", job_info['job_id'])
+        logger.info("[STEP 8] Job Title: %s", job_info['job_title'])
+        
+        # Click the button inside the custom element in one script: the
+        # shadow root is searched first (only when there is one), then the
+        # element's regular children
         try:
-            buttons_inside = apply_element.find_elements(By.TAG_NAME, "button")
-            if buttons_inside:
-                print(f"[STEP 8] Found {len(buttons_inside)} buttons inside apply-button-wc")
-                for button in buttons_inside:
-                    if button.is_displayed():
-                        return _click_element_safely(driver, button)
-        except:
-            pass
-        
-        # Try to access shadow DOM if it exists
-        try:
-            shadow_root = driver.execute_script("return arguments[0].shadowRoot", apply_element)
-            if shadow_root:
-                print("[STEP 8] Found shadow root in apply-button-wc")
-                # Look for button in shadow DOM
-                shadow_buttons = driver.execute_script("""
-                    var shadowRoot = arguments[0].shadowRoot;
-                    if (shadowRoot) {
-                        var buttons = shadowRoot.querySelectorAll('button');
-                        if (buttons.length > 0) {
-                            buttons[0].click();
-                            return true;
-                        }
+            previous_url = driver.current_url
+            result = driver.execute_script("""
+                const host = arguments[0];
+                const roots = host.shadowRoot ? [host.shadowRoot, host] : [host];
+                for (const root of roots) {
+                    const button = Array.from(root.querySelectorAll('button')).find(function(b) {
+                        const rect = b.getBoundingClientRect();
+                        return rect.width > 0 && rect.height > 0;
+                    });
+                    if (button) {
+                        button.click();
+                        return {clicked: true, reason: root === host ? 'regular DOM' : 'shadow DOM'};
                     }
-                    return false;
-                """, apply_element)
-                
-                if shadow_buttons:
-                    print("[STEP 8] Clicked button in shadow DOM")
-                    time.sleep(3)
-                    return True
-        except:
-            pass
+                }
+                return {clicked: false, reason: host.shadowRoot ? 'no button in shadow DOM' : 'no shadow root'};
+            """, apply_element)
+            
+            if result['clicked']:
+                logger.debug("[STEP 8] Clicked button in %s of apply-button-wc", result['reason'])
+                _wait_for_click_effect(driver, apply_element, previous_url)
+                return True
+            logger.debug("[STEP 8] No button inside apply-button-wc (%s)", result['reason'])
+        except Exception as e:
+            logger.warning("[STEP 8] Error clicking button inside apply-button-wc: %s", e)
         
         # Try clicking the custom element itself
-        print("[STEP 8] Attempting to click the apply-button-wc element directly...")
+        logger.debug("[STEP 8] Attempting to click the apply-button-wc element directly...")
         return _click_element_safely(driver, apply_element)
         
     except TimeoutException:
-        print("[STEP 8] Timeout waiting for apply-button-wc element")
+        logger.warning("[STEP 8] Timeout waiting for apply-button-wc element")
     except Exception as e:
-        print(f"[STEP 8] Error handling custom apply button: {str(e)}")
+        logger.warning("[STEP 8] Error handling custom apply button: %s", e)
     
     return False
 
@@ -143,77 +173,72 @@ def _find_apply_button_in_container(driver):
     try:
         # Find the applyButton div
         apply_div = driver.find_element(By.ID, "applyButton")
-        print("[STEP 8] Found applyButton div")
-        
-        # Look for any clickable elements inside
-        clickable_elements = []
-        
-        # Check for buttons
-        buttons = apply_div.find_elements(By.TAG_NAME, "button")
-        clickable_elements.extend(buttons)
-        
-        # Check for links
-        links = apply_div.find_elements(By.TAG_NAME, "a")
-        clickable_elements.extend(links)
-        
-        # Check for any element with onclick
-        onclick_elements = apply_div.find_elements(By.XPATH, ".//*[@onclick]")
-        clickable_elements.extend(onclick_elements)
-        
-        print(f"[STEP 8] Found {len(clickable_elements)} clickable elements in applyButton div")
+        logger.debug("[STEP 8] Found applyButton div")
+        
+        # Look for any clickable elements inside (buttons, links and anything
+        # with an onclick handler) in one query, in document order
+        clickable_elements = apply_div.find_elements(By.XPATH, ".//button | .//a | .//*[@onclick]")
+        
+        logger.debug("[STEP 8] Found %s clickable elements in applyButton div", len(clickable_elements))
+        
+        # Tag, text and visibility for every element in one round-trip
+        element_infos = driver.execute_script("""
+            return arguments[0].map(function(el) {
+                const rect = el.getBoundingClientRect();
+                return {
+                    tag: el.tagName.toLowerCase(),
+                    text: (el.innerText || '').trim(),
+                    visible: rect.width > 0 && rect.height > 0
+                };
+            });
+        """, clickable_elements) if clickable_elements else []
+        visible = [(element, info) for element, info in zip(clickable_elements, element_infos) if info['visible']]
         
         # Try each clickable element
-        for element in clickable_elements:
-            if element.is_displayed():
-                element_text = element.text.strip()
-                element_tag = element.tag_name
-                print(f"[STEP 8] Found {element_tag}: '{element_text}'")
-                
-                if 'apply' in element_text.lower() or not element_text:
-                    return element
+        for element, info in visible:
+            logger.debug("[STEP 8] Found %s: '%s'", info['tag'], info['text'])
+            
+            if 'apply' in info['text'].lower() or not info['text']:
+                return element
         
         # If no obvious apply button, return the first visible clickable element
-        for element in clickable_elements:
-            if element.is_displayed():
-                return element
+        if visible:
+            return visible[0][0]
                 
     except NoSuchElementException:
-        print("[STEP 8] applyButton div not found")
+        logger.warning("[STEP 8] applyButton div not found")
     except Exception as e:
-        print(f"[STEP 8] Error finding button in container: {str(e)}")
+        logger.warning("[STEP 8] Error finding button in container: %s", e)
     
     return None
 
-def _extract_and_construct_apply_url(driver):
+def _extract_and_construct_apply_url(driver, job_info=None):
     """Extract job ID and construct the apply URL"""
     try:
         # Get job ID from various sources
         job_id = None
         
-        # Try from apply-button-wc
-        try:
-            apply_element = driver.find_element(By.TAG_NAME, "apply-button-wc")
-            job_id = apply_element.get_attribute('job-id')
-            print(f"[STEP 8] Got job ID from apply-button-wc: {job_id}")
-        except:
-            pass
+        # Try from apply-button-wc (already read by step_8_click_next)
+        if job_info and job_info.get('job_id'):
+            job_id = job_info['job_id']
+            logger.debug("[STEP 8] Got job ID from apply-button-wc: %s", job_id)
         
         # Try from dhi-job-search-save-job
         if not job_id:
             try:
                 save_element = driver.find_element(By.TAG_NAME, "dhi-job-search-save-job")
                 job_id = save_element.get_attribute('job-id')
-                print(f"[STEP 8] Got job ID from save element: {job_id}")
-            except:
+                logger.debug("[STEP 8] Got job ID from save element: %s", job_id)
+            except (NoSuchElementException, StaleElementReferenceException, WebDriverException):
                 pass
         
         # Try from URL
         if not job_id:
             current_url = driver.current_url
-            job_id_match = re.search(r'/job-detail/([a-f0-9-]+)', current_url)
+            job_id_match = _JOB_ID_RE.search(current_url)
             if job_id_match:
                 job_id = job_id_match.group(1)
-                print(f"[STEP 8] Got job ID from URL: {job_id}")
+                logger.debug("[STEP 8] Got job ID from URL: %s", job_id)
         
         if job_id:
             # Construct apply URL (common patterns)
@@ -230,54 +255,49 @@ def _extract_and_construct_apply_url(driver):
             return possible_urls[0]
             
     except Exception as e:
-        print(f"[STEP 8] Error extracting job ID: {str(e)}")
+        logger.warning("[STEP 8] Error extracting job ID: %s", e)
     
     return None
 
 def _click_element_safely(driver, element):
     """Safely click an element using multiple methods"""
     try:
+        previous_url = driver.current_url
+        
         # Scroll into view
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-        time.sleep(1)
-        
-        # Method 1: JavaScript click
-        try:
-            driver.execute_script("arguments[0].click();", element)
-            print("[STEP 8] Clicked using JavaScript")
-            time.sleep(3)
-            return True
-        except:
-            pass
         
-        # Method 2: Regular click
+        # JavaScript click (native, then synthetic event) in one round-trip
         try:
-            element.click()
-            print("[STEP 8] Clicked using regular click")
-            time.sleep(3)
-            return True
-        except:
+            result = driver.execute_script(CLICK_JS, element)
+            if result['method']:
+                logger.debug("[STEP 8] Clicked using JavaScript (%s)", result['method'])
+                _wait_for_click_effect(driver, element, previous_url)
+                return True
+            logger.warning("[STEP 8] JavaScript click failed: %s", result['error'])
+        except (NoSuchElementException, StaleElementReferenceException, WebDriverException):
             pass
         
-        # Method 3: Action chains
+        # Fall back to action chains
         try:
             ActionChains(driver).move_to_element(element).click().perform()
-            print("[STEP 8] Clicked using action chains")
-            time.sleep(3)
+            logger.debug("[STEP 8] Clicked using action chains")
+            _wait_for_click_effect(driver, element, previous_url)
             return True
-        except:
-            pass
-        
-        # Method 4: Send Enter key
-        try:
-            element.send_keys('\n')
-            print("[STEP 8] Sent Enter key")
-            time.sleep(3)
-            return True
-        except:
+        except (NoSuchElementException, StaleElementReferenceException, WebDriverException):
             pass
             
     except Exception as e:
-        print(f"[STEP 8] Error clicking element: {str(e)}")
+        logger.warning("[STEP 8] Error clicking element: %s", e)
     
-    return False
\ No newline at end of file
+    return False
+
+def _wait_for_click_effect(driver, element, previous_url, timeout=3):
+    """Wait until a click navigates or replaces the clicked element"""
+    try:
+        explicit_wait(driver, timeout).until(EC.any_of(
+            EC.url_changes(previous_url),
+            EC.staleness_of(element)
+        ))
+    except TimeoutException:
+        pass
@@ -1,10 +1,15 @@
 # dice_assistant/dice_step_9.py
 
-import time
+import os
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
+from selenium.webdriver.common.action_chains import ActionChains
+
+from .logging_config import get_step_logger
+from .selenium_helpers import CLICK_JS, explicit_wait
+
+logger = get_step_logger(__name__)
 
 def step_9_submit_application(driver):
     """
@@ -17,264 +22,256 @@ def step_9_submit_application(driver):
         bool: True if successful, False otherwise
     """
     try:
-        print("\n" + "="*60)
-        print("STEP 9: Clicking Next button on application form")
-        print("="*60)
+        logger.info("\n%s\nSTEP 9: Clicking Next button on application form\n%s", "="*60, "="*60)
         
-        # Wait for page to load
-        print("[STEP 9] Waiting for application form to load...")
-        time.sleep(3)
+        # Wait for the form's navigation buttons to render
+        logger.debug("[STEP 9] Waiting for application form to load...")
+        try:
+            explicit_wait(driver).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "button.btn-next, .navigation-buttons button"))
+            )
+        except TimeoutException:
+            logger.warning("[STEP 9] Timeout waiting for application form buttons")
         
-        current_url = driver.current_url
-        print(f"[STEP 9] Current URL: {current_url}")
+        # URL and ready state in one round-trip
+        page_state = driver.execute_script("return {url: location.href, ready: document.readyState};")
+        current_url = page_state['url']
+        logger.info("[STEP 9] Current URL: %s (readyState: %s)", current_url, page_state['ready'])
         
         # Verify we're on the application page
         if 'apply' in current_url.lower():
-            print("[STEP 9] Confirmed on application page")
+            logger.debug("[STEP 9] Confirmed on application page")
         
         # Find and click the Next button
-        print("[STEP 9] Looking for Next button...")
+        logger.debug("[STEP 9] Looking for Next button...")
         next_button = _find_next_button(driver)
         
         if next_button:
-            print("[STEP 9] Found Next button")
+            logger.info("[STEP 9] Found Next button")
             
-            # Scroll button into view
+            # Scroll button into view and wait until it can be clicked
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-            time.sleep(1)
+            try:
+                explicit_wait(driver, 5).until(EC.element_to_be_clickable(next_button))
+            except TimeoutException:
+                pass
             
             # Click the button
-            print("[STEP 9] Clicking Next button...")
+            logger.debug("[STEP 9] Clicking Next button...")
             success = _click_button_safely(driver, next_button)
             
             if success:
-                print("[STEP 9] Successfully clicked Next button")
-                time.sleep(3)  # Wait for next page to load
+                logger.info("[STEP 9] Successfully clicked Next button")
+                
+                # Wait for next page to load (URL change or button replaced)
+                try:
+                    explicit_wait(driver).until(EC.any_of(
+                        EC.url_changes(current_url),
+                        EC.staleness_of(next_button)
+                    ))
+                except TimeoutException:
+                    pass
                 
                 # Verify we moved to next step
                 new_url = driver.current_url
                 if new_url != current_url:
-                    print(f"[STEP 9] SUCCESS: Navigated to next step")
-                    print(f"[STEP 9] New URL: {new_url}")
+                    logger.info("[STEP 9] SUCCESS: Navigated to next step")
+                    logger.info("[STEP 9] New URL: %s", new_url)
                 else:
-                    print("[STEP 9] SUCCESS: Clicked Next (same URL but likely new content)")
+                    logger.info("[STEP 9] SUCCESS: Clicked Next (same URL but likely new content)")
                 
                 return True
             else:
-                print("[STEP 9] ERROR: Failed to click Next button")
+                logger.error("[STEP 9] ERROR: Failed to click Next button")
                 return False
         else:
-            print("[STEP 9] ERROR: Could not find Next button")
+            logger.error("[STEP 9] ERROR: Could not find Next button")
             _debug_page_state(driver)
             return False
             
     except Exception as e:
-        print(f"[STEP 9 ERROR] Unexpected error: {str(e)}")
-        print(f"[STEP 9 ERROR] Error type: {type(e).__name__}")
-        if hasattr(e, '__traceback__'):
-            import traceback
-            print(f"[STEP 9 ERROR] Traceback: {traceback.format_exc()}")
+        logger.exception("[STEP 9 ERROR] Unexpected error: %s (%s)", e, type(e).__name__)
         return False
 
 def _find_next_button(driver):
     """Find the Next button using multiple strategies"""
     
-    # Strategy 1: Direct selectors based on the provided HTML
+    # Strategy 1: Direct selectors based on the provided HTML, most specific first
     selectors = [
-        # Exact class match
-        "button.seds-button-primary.btn-next",
+        # Next class (also covers button.seds-button-primary.btn-next)
         "button.btn-next",
         
-        # Button with Next text
-        "button[type='button'] span:contains('Next')",
-        
-        # Inside navigation-buttons div
-        ".navigation-buttons button.btn-next",
+        # Primary button inside navigation-buttons div
         ".navigation-buttons button.seds-button-primary",
         
-        # Generic Next button
-        "button:contains('Next')",
-        
         # Data attribute selector
         "button[data-v-866481c4]"
     ]
     
-    # Try CSS selectors first
-    for selector in selectors:
-        try:
-            # Skip :contains selectors for CSS
-            if ':contains' in selector:
-                continue
-                
-            buttons = driver.find_elements(By.CSS_SELECTOR, selector)
-            for button in buttons:
-                if button.is_displayed() and button.is_enabled():
-                    # Check if it's a Next button
-                    button_text = button.text.strip()
-                    if 'next' in button_text.lower() or button_text == '':
-                        # Check for span inside with Next text
-                        spans = button.find_elements(By.TAG_NAME, "span")
-                        for span in spans:
-                            if 'next' in span.text.lower():
-                                print(f"[STEP 9] Found Next button using selector: {selector}")
-                                return button
-                        
-                        # If button has btn-next class, trust it
-                        if 'btn-next' in button.get_attribute('class'):
-                            print(f"[STEP 9] Found Next button using selector: {selector}")
-                            return button
-        except:
-            continue
-    
-    # Strategy 2: XPath selectors
-    xpath_selectors = [
-        # Button containing Next text
-        "//button[contains(text(),'Next')]",
-        "//button[.//span[contains(text(),'Next')]]",
-        "//button[@class='seds-button-primary btn-next']",
-        "//button[contains(@class,'btn-next')]",
+    # Strategies 1, 2 and 4 run in the browser in one round-trip: the
+    # selector list, then any Next-looking button, then the primary button
+    # in the navigation area. Selenium marshals the winning element back.
+    try:
+        found = driver.execute_script("""
+            const selectors = arguments[0];
+            const usable = function(b) {
+                const rect = b.getBoundingClientRect();
+                return rect.width > 0 && rect.height > 0 && !b.disabled;
+            };
+            const spanSaysNext = function(b) {
+                return Array.from(b.querySelectorAll('span')).some(function(s) {
+                    return s.innerText.trim().toLowerCase().includes('next');
+                });
+            };
+            
+            for (const selector of selectors) {
+                for (const b of document.querySelectorAll(selector)) {
+                    const text = b.innerText.trim().toLowerCase();
+                    if (usable(b) && (text.includes('next') || text === '') &&
+                            (spanSaysNext(b) || b.classList.contains('btn-next'))) {
+                        return {button: b, strategy: 'selector: ' + selector};
+                    }
+                }
+            }
+            
+            for (const b of document.querySelectorAll('button')) {
+                if (usable(b) && (b.classList.contains('btn-next') ||
+                        b.innerText.trim().toLowerCase() === 'next' || spanSaysNext(b))) {
+                    return {button: b, strategy: 'button text/class'};
+                }
+            }
+            
+            for (const b of document.querySelectorAll('.navigation-buttons button.seds-button-primary')) {
+                if (usable(b)) {
+                    return {button: b, strategy: 'navigation area'};
+                }
+            }
+            return null;
+        """, selectors)
         
-        # Button in navigation area
-        "//div[@class='navigation-buttons btn-right']//button[contains(@class,'btn-next')]",
-        "//div[contains(@class,'navigation-buttons')]//button[contains(@class,'seds-button-primary')]"
-    ]
-    
-    for xpath in xpath_selectors:
-        try:
-            buttons = driver.find_elements(By.XPATH, xpath)
-            for button in buttons:
-                if button.is_displayed() and button.is_enabled():
-                    print(f"[STEP 9] Found Next button using XPath: {xpath}")
-                    return button
-        except:
-            continue
+        if found:
+            logger.debug("[STEP 9] Found Next button using %s", found['strategy'])
+            return found['button']
+    except Exception as e:
+        logger.warning("[STEP 9] Error scanning for Next button: %s", e)
     
-    # Strategy 3: Wait for clickable element
+    # Strategy 3: Wait for clickable element (it may still be rendering)
     try:
-        wait = WebDriverWait(driver, 10)
+        wait = explicit_wait(driver)
         next_button = wait.until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, "button.btn-next"))
         )
-        print("[STEP 9] Found Next button using WebDriverWait")
+        logger.debug("[STEP 9] Found Next button using WebDriverWait")
         return next_button
     except TimeoutException:
         pass
     
-    # Strategy 4: Find all buttons and check text
-    try:
-        all_buttons = driver.find_elements(By.TAG_NAME, "button")
-        print(f"[STEP 9] Checking {len(all_buttons)} buttons for Next text...")
-        
-        for button in all_buttons:
-            if button.is_displayed() and button.is_enabled():
-                button_text = button.text.strip()
-                button_class = button.get_attribute('class') or ''
-                
-                # Check button text or span text inside
-                if button_text.lower() == 'next':
-                    print(f"[STEP 9] Found Next button by text: '{button_text}'")
-                    return button
-                
-                # Check class for btn-next
-                if 'btn-next' in button_class:
-                    print(f"[STEP 9] Found Next button by class: '{button_class}'")
-                    return button
-                
-                # Check spans inside button
-                spans = button.find_elements(By.TAG_NAME, "span")
-                for span in spans:
-                    if span.text.strip().lower() == 'next':
-                        print(f"[STEP 9] Found Next button by span text")
-                        return button
-    except:
-        pass
-    
-    print("[STEP 9] Next button not found with any strategy")
+    logger.warning("[STEP 9] Next button not found with any strategy")
     return None
 
 def _click_button_safely(driver, button):
-    """Safely click the button using multiple methods"""
-    click_methods = [
-        ("JavaScript click", lambda: driver.execute_script("arguments[0].click();", button)),
-        ("JavaScript with events", lambda: driver.execute_script("""
-            var event = new MouseEvent('click', {
-                view: window,
-                bubbles: true,
-                cancelable: true
-            });
-            arguments[0].dispatchEvent(event);
-        """, button)),
-        ("Regular click", lambda: button.click()),
-        ("JavaScript focus and click", lambda: (
-            driver.execute_script("arguments[0].focus();", button),
-            time.sleep(0.3),
-            driver.execute_script("arguments[0].click();", button)
-        ))
-    ]
+    """Safely click the button, in the browser first and with action chains as a fallback"""
+    # JavaScript click (native, then synthetic event) in one round-trip
+    try:
+        logger.debug("[STEP 9] Trying: JavaScript click")
+        result = driver.execute_script(CLICK_JS, button)
+        if not result['method']:
+            logger.warning("[STEP 9] JavaScript click failed: %s", result['error'])
+        elif _click_took_effect(driver, button, f"JavaScript click ({result['method']})"):
+            return True
+    except Exception as e:
+        logger.warning("[STEP 9] JavaScript click failed: %s", e)
     
-    for method_name, click_method in click_methods:
-        try:
-            print(f"[STEP 9] Trying: {method_name}")
-            click_method()
-            
-            # Small wait to see if click worked
-            time.sleep(1)
-            
-            # Check if button is still visible (might indicate it didn't work)
-            try:
-                if not button.is_displayed():
-                    print(f"[STEP 9] {method_name} succeeded - button no longer visible")
-                    return True
-            except:
-                # Element might be stale, which is good (page changed)
-                print(f"[STEP 9] {method_name} succeeded - element state changed")
-                return True
-            
-            # Check for any loading indicators
-            loading_indicators = driver.find_elements(By.CSS_SELECTOR, "[class*='loading'], [class*='spinner']")
-            if any(indicator.is_displayed() for indicator in loading_indicators):
-                print(f"[STEP 9] {method_name} succeeded - loading indicator detected")
-                return True
-                
-        except Exception as e:
-            print(f"[STEP 9] {method_name} failed: {str(e)}")
-            continue
+    # Fall back to action chains
+    try:
+        logger.debug("[STEP 9] Trying: Action chains click")
+        ActionChains(driver).move_to_element(button).click().perform()
+        if _click_took_effect(driver, button, "Action chains click"):
+            return True
+    except Exception as e:
+        logger.warning("[STEP 9] Action chains click failed: %s", e)
     
     # If we tried all methods, assume the last one worked
     return True
 
+def _click_took_effect(driver, button, method_name):
+    """Check whether a click visibly did something (button gone or page loading)"""
+    # Short wait to see if click worked (button replaced or hidden)
+    try:
+        explicit_wait(driver, 1).until(EC.any_of(
+            EC.staleness_of(button),
+            EC.invisibility_of_element(button)
+        ))
+    except TimeoutException:
+        pass
+    
+    # Check if button is still visible (might indicate it didn't work)
+    try:
+        if not button.is_displayed():
+            logger.debug("[STEP 9] %s succeeded - button no longer visible", method_name)
+            return True
+    except (NoSuchElementException, StaleElementReferenceException, WebDriverException):
+        # Element might be stale, which is good (page changed)
+        logger.debug("[STEP 9] %s succeeded - element state changed", method_name)
+        return True
+    
+    # Check for any visible loading indicators (evaluated in the browser)
+    if driver.execute_script("""
+        return Array.from(document.querySelectorAll("[class*='loading'], [class*='spinner']")).some(function(el) {
+            const rect = el.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0;
+        });
+    """):
+        logger.debug("[STEP 9] %s succeeded - loading indicator detected", method_name)
+        return True
+    
+    return False
+
 def _debug_page_state(driver):
-    """Debug helper to understand page state"""
+    """Debug helper to understand page state (only runs when DICE_DEBUG is set)"""
+    if not os.environ.get('DICE_DEBUG'):
+        return
+    
     try:
-        print("\n[DEBUG] Page State Analysis:")
-        print(f"[DEBUG] Current URL: {driver.current_url}")
+        logger.info("\n[DEBUG] Page State Analysis:")
+        logger.info("[DEBUG] Current URL: %s", driver.current_url)
         
-        # Look for navigation buttons
-        nav_buttons = driver.find_elements(By.CSS_SELECTOR, ".navigation-buttons button")
-        print(f"[DEBUG] Found {len(nav_buttons)} navigation buttons")
+        # Look for navigation buttons (text, class and state in one round-trip)
+        nav_buttons = driver.execute_script("""
+            return Array.from(document.querySelectorAll('.navigation-buttons button')).map(function(b) {
+                const rect = b.getBoundingClientRect();
+                return {
+                    text: b.innerText.trim(),
+                    cls: b.className,
+                    visible: rect.width > 0 && rect.height > 0,
+                    enabled: !b.disabled
+                };
+            });
+        """)
+        logger.info("[DEBUG] Found %s navigation buttons", len(nav_buttons))
         
         for i, button in enumerate(nav_buttons):
-            try:
-                text = button.text.strip()
-                classes = button.get_attribute('class')
-                visible = button.is_displayed()
-                enabled = button.is_enabled()
-                print(f"[DEBUG] Nav button {i}: text='{text}', class='{classes}', visible={visible}, enabled={enabled}")
-            except:
-                pass
+            logger.info("[DEBUG] Nav button %s: text='%s', class='%s', visible=%s, enabled=%s",
+                        i, button['text'], button['cls'], button['visible'], button['enabled'])
         
-        # Check for any buttons with 'next' in class or text
-        next_like_buttons = driver.find_elements(By.XPATH, 
-            "//*[contains(@class,'next') or contains(text(),'Next') or contains(text(),'next')]")
-        print(f"[DEBUG] Found {len(next_like_buttons)} elements with 'next' reference")
+        # Count elements with 'next' in their class, or buttons whose text says
+        # next, in the browser (a count, not element references)
+        next_like_count = driver.execute_script("""
+            const byClass = document.querySelectorAll("[class*='next' i]").length;
+            const byText = Array.from(document.querySelectorAll('button')).filter(function(b) {
+                return /next/i.test(b.innerText || '');
+            }).length;
+            return byClass + byText;
+        """)
+        logger.info("[DEBUG] Found %s elements with 'next' reference", next_like_count)
         
         # Save page source for analysis
         try:
             with open("step9_debug.html", "w", encoding="utf-8") as f:
                 f.write(driver.page_source)
-            print("[DEBUG] Page source saved to step9_debug.html")
-        except:
+            logger.info("[DEBUG] Page source saved to step9_debug.html")
+        except (OSError, WebDriverException):
             pass
             
     except Exception as e:
-        print(f"[DEBUG ERROR] {str(e)}")
\ No newline at end of file
+        logger.error("[DEBUG ERROR] %s", e)
\ No newline at end of file
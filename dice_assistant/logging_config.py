@@ -0,0 +1,27 @@
+# dice_assistant/logging_config.py
+
+"""
+Logging setup shared by the Dice step modules
+
+Step messages keep their "[STEP N]" prefixes, so the handler prints the bare
+message. The level comes from DICE_LOG_LEVEL (default INFO); per-selector and
+per-strategy chatter is logged at DEBUG and skipped entirely at INFO.
+"""
+
+import logging
+import os
+import sys
+
+
+def get_step_logger(name):
+    """Get a logger for a step module, attaching a stdout handler once"""
+    logger = logging.getLogger(name)
+
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(os.environ.get('DICE_LOG_LEVEL', 'INFO').upper())
+        logger.propagate = False
+
+    return logger
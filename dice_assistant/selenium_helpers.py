@@ -0,0 +1,41 @@
+# dice_assistant/selenium_helpers.py
+
+"""
+Selenium helpers shared by the Dice step modules
+"""
+
+import os
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+# Explicit wait budget and polling interval, overridable per environment
+WAIT_TIMEOUT = int(os.environ.get('INCODEV_WAIT_TIMEOUT', '10'))
+WAIT_POLL = float(os.environ.get('INCODEV_WAIT_POLL', '0.25'))
+
+
+def explicit_wait(driver, timeout=None):
+    """WebDriverWait using the configured timeout and polling interval"""
+    return WebDriverWait(
+        driver,
+        WAIT_TIMEOUT if timeout is None else timeout,
+        poll_frequency=WAIT_POLL,
+        ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+    )
+
+
+# Native click, falling back to a synthetic click event when it throws
+CLICK_JS = """
+    const el = arguments[0];
+    try {
+        el.click();
+        return {method: 'native', error: null};
+    } catch (e) {
+        try {
+            el.dispatchEvent(new MouseEvent('click', {bubbles: true, cancelable: true, view: window}));
+            return {method: 'event', error: null};
+        } catch (e2) {
+            return {method: null, error: String(e2)};
+        }
+    }
+"""
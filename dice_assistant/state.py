@@ -0,0 +1,20 @@
+# dice_assistant/state.py
+
+"""
+Session state shared between the Dice step functions
+
+Replaces attributes that used to be stored on the Selenium driver itself
+(e.g. driver.original_window), which could silently outlive the window they
+pointed at.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class SessionState:
+    """Windows/URLs the job loop needs to get back to the results page"""
+    results_window: str
+    results_url: str
+    job_tabs: List[str] = field(default_factory=list)
@@ -1,4 +1,3 @@
-import time
 
 class GlassdoorAssistant:
     """Glassdoor Platform Assistant - Placeholder for future development"""
@@ -15,9 +14,6 @@ class GlassdoorAssistant:
             print(f"Glassdoor automation requested for {user_profile.get('name', 'User')}")
             print("Glassdoor automation is coming soon!")
             
-            # Simulate some processing time
-            time.sleep(2)
-            
             return {
                 'success': False,
                 'error': 'Glassdoor automation coming soon',
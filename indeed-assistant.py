@@ -2,16 +2,19 @@
 Indeed Assistant v3 - Main orchestration with email verification support
 """
 
-import time
 import os
+import re
 import sys
+import base64
+import queue
+import atexit
+import threading
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
 # Add indeed_assistant to path
@@ -35,10 +38,193 @@ from indeed_assistant import (
 if EMAIL_VERIFICATION_AVAILABLE:
     from indeed_assistant import IndeedEmailVerification
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Resolved chromedriver path, cached for the life of the process; the lock
+# keeps concurrent runs from installing the driver more than once
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+
+def _get_chromedriver_path():
+    """
+    Resolve the chromedriver path once
+    
+    Uses CHROMEDRIVER_PATH (default /usr/local/bin/chromedriver) when that file
+    exists, so images with a pinned driver never contact the driver repository;
+    ChromeDriverManager is only the fallback for development machines.
+    """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        with _chromedriver_lock:
+            if _chromedriver_path is None:
+                path = os.environ.get('CHROMEDRIVER_PATH', '/usr/local/bin/chromedriver')
+                if os.path.isfile(path) and os.access(path, os.X_OK):
+                    _chromedriver_path = path
+                else:
+                    _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+
+# Idle Chrome drivers kept between runs so each automation doesn't pay the
+# driver install and browser cold start. Filled lazily as runs finish.
+# A size of 0 or less turns pooling off (every driver is quit after its run).
+_DRIVER_POOL_SIZE = int(os.environ.get('INDEED_DRIVER_POOL_SIZE', '2'))
+_DRIVER_POOL = queue.Queue(maxsize=max(_DRIVER_POOL_SIZE, 1))
+
+# Origins whose site storage is wiped before a driver goes back to the pool
+_INDEED_ORIGINS = (
+    "https://www.indeed.com",
+    "https://indeed.com",
+    "https://secure.indeed.com",
+)
+
+
+def _close_pooled_drivers():
+    """Quit every idle pooled driver (registered to run at exit)"""
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_close_pooled_drivers)
+
 
 class IndeedAssistant:
     """Main Indeed automation assistant with email verification support"""
     
+    # Email field on the login page
+    _EMAIL_SELECTORS = (
+        "input[id='ifl-InputFormField-3']",
+        "input[type='email']",
+        "input[name='__email']",
+        "input[data-testid='email-input']"
+    )
+    
+    # Continue button after entering the email
+    _CONTINUE_SELECTORS = (
+        "button[type='submit']",
+        "button[data-tn-element='auth-page-email-submit-button']",
+        "button.dd-privacy-allow"
+    )
+    
+    # Login error messages on the auth page
+    _LOGIN_ERROR_SELECTORS = (
+        "[data-testid='login-error']",
+        ".error-message",
+        "[role='alert']"
+    )
+    
+    # User menu / profile elements shown once logged in
+    _SUCCESS_SELECTORS = (
+        "div[data-gnav-element='profileMenu']",
+        "button[aria-label*='account']",
+        "a[href*='/myjobs']",
+        "span[class*='UserName']",
+        "button[id*='account-menu']",
+        "nav a[href*='/profile']"
+    )
+    
+    # Verification code input on the email verification screen
+    _CODE_INPUT_SELECTORS = (
+        "input[type='text'][maxlength='6']",
+        "input[aria-label*='verification']",
+        "input[aria-label*='code']",
+        "input[placeholder*='code']",
+        "input[name*='code']",
+        "[data-testid='verification-code-input']"
+    )
+    
+    # Inputs that only appear on the email verification screen
+    _VERIFICATION_SELECTORS = (
+        "input[aria-label*='verification']",
+        "input[aria-label*='code']",
+        "input[placeholder*='code']",
+        "[data-testid='verification-code-input']",
+        "input[maxlength='6']",
+        "input[type='text'][maxlength='6']"
+    )
+    
+    # Job cards on the search results page
+    _JOB_CARD_SELECTORS = (
+        "[data-jk]",  # Job cards with data-jk attribute
+        ".jobsearch-SerpJobCard",  # Classic job card class
+        ".job_seen_beacon",  # New job card class
+        "[data-testid='job-card']",  # Test ID for job cards
+        "a[id^='job_']"  # Job links with ID pattern
+    )
+    
+    # "No results" messages on the search results page
+    _NO_RESULTS_SELECTORS = (
+        "[class*='no-results']",
+        "[class*='jobsearch-NoResult']"
+    )
+    
+    # "Sign in another way" links on the passkey screen (CSS-expressible ones)
+    _ALT_SIGNIN_SELECTORS = (
+        "a[href*='alternative']",
+        "button[aria-label*='alternative']"
+    )
+    
+    # Page text (lowercased) indicating the passkey screen. "passkey" already
+    # covers "sign in with your passkey" and "use your passkey", so only the
+    # two independent terms are scanned for.
+    _PASSKEY_RE = re.compile("passkey|passwordless")
+    
+    # Page text (lowercased) indicating the email verification screen
+    _VERIFICATION_RE = re.compile("|".join(map(re.escape, (
+        "verification code",
+        "verify your identity",
+        "we sent a code",
+        "enter the code",
+        "check your email",
+        "verification email",
+        "6-digit code",
+        "sign in code"
+    ))))
+    
+    # Third-party ad/analytics requests that don't affect the pages' DOM
+    _BLOCKED_URL_PATTERNS = (
+        "*doubleclick.net*",
+        "*googletagmanager.com*",
+        "*google-analytics.com*",
+        "*segment.io*",
+        "*hotjar.com*",
+        "*criteo.com*",
+        "*.facebook.com*",
+        "*bat.bing.com*"
+    )
+    
+    # Visibility helpers prepended to the in-browser scripts: an element
+    # counts as visible when it has a non-empty bounding box, and selectors
+    # the browser can't parse (e.g. jQuery's :contains) are skipped
+    _VISIBLE_JS = """
+        const isVisible = function(e) {
+            const r = e.getBoundingClientRect();
+            return r.width > 0 && r.height > 0;
+        };
+        const firstVisible = function(selectors) {
+            for (const s of selectors) {
+                let els;
+                try {
+                    els = document.querySelectorAll(s);
+                } catch (e) {
+                    continue;
+                }
+                for (const e of els) {
+                    if (isVisible(e)) return e;
+                }
+            }
+            return null;
+        };
+    """
+    
     def __init__(self, user_email, keyword="", location=""):
         print(f"🔍 INDEED: Initializing Indeed Assistant v3")
         self.user_email = user_email
@@ -46,6 +232,10 @@ class IndeedAssistant:
         self.location = location or "United States"  # Default if not provided
         self.credentials = IndeedCredentials(user_email)
         self.applications_submitted = 0
+        # Seconds to wait for the verification email; lower it when the
+        # verifier is push-based (IMAP IDLE) rather than polling
+        self.verification_wait = int(os.environ.get('INDEED_VERIFICATION_WAIT', '60'))
+        self._debug = os.environ.get('INDEED_DEBUG', '').lower() in ('1', 'true', 'yes')
         self.max_applications = 10  # Configurable limit
         
     def run_automation(self, user_data, resume_data):
@@ -68,8 +258,8 @@ class IndeedAssistant:
                 print("⚠️ INDEED: Email verification available but email access failed")
                 print("⚠️ INDEED: Continuing without email verification support")
         
-        # Create driver
-        driver = self._create_driver()
+        # Reuse a pooled driver when one is idle, otherwise create one
+        driver = self._acquire_driver()
         wait = WebDriverWait(driver, 10)
         
         try:
@@ -81,19 +271,15 @@ class IndeedAssistant:
                     'total_applications': 0
                 }
             
-            # Small pause after login to ensure session is established
-            time.sleep(2)
-            
             # Phase 2: Navigate to filtered search results
             # Single URL with all filters - no tiers needed
             indeed_url = f"https://www.indeed.com/jobs?q={self.keyword}&l={self.location}&fromage=1&iafilter=1"
             print(f"🌐 INDEED: Navigating to filtered search: {indeed_url}")
             
             driver.get(indeed_url)
-            time.sleep(3)  # Allow page to load
             
-            # Verify we have job results
-            if not self._verify_job_results(driver):
+            # Verify we have job results; the short wait absorbs page-load jitter
+            if not self._verify_job_results(driver, WebDriverWait(driver, 5)):
                 print("❌ INDEED: No job results found with current filters")
                 return {
                     'success': False,
@@ -128,14 +314,60 @@ class IndeedAssistant:
                 'total_applications': self.applications_submitted
             }
         finally:
-            print(f"🏁 INDEED: Closing browser. Submitted {self.applications_submitted} applications")
-            driver.quit()
+            print(f"🏁 INDEED: Releasing browser. Submitted {self.applications_submitted} applications")
+            self._release_driver(driver)
     
     def increment_applications(self):
         """Called by step functions when an application is successfully submitted"""
         self.applications_submitted += 1
         print(f"✅ INDEED: Application submitted! Total: {self.applications_submitted}")
     
+    def _acquire_driver(self):
+        """Take a live idle driver from the pool, or create a new one"""
+        while True:
+            try:
+                driver = _DRIVER_POOL.get_nowait()
+            except queue.Empty:
+                return self._create_driver()
+            
+            # A browser can crash while pooled; probe it before handing it out
+            try:
+                driver.current_url
+            except WebDriverException:
+                print("⚠️ INDEED: Pooled Chrome driver is dead, discarding it")
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                continue
+            
+            print("♻️ INDEED: Reusing pooled Chrome driver")
+            return driver
+    
+    def _release_driver(self, driver):
+        """Clear the session and return the driver to the pool (quit it if the pool is full or disabled)"""
+        try:
+            if _DRIVER_POOL_SIZE <= 0:
+                raise queue.Full
+            # Clears cookies for every domain, not just the current one
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            # localStorage, sessionStorage, IndexedDB etc. so nothing of this
+            # user's session reaches the next one
+            for origin in _INDEED_ORIGINS:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    'origin': origin,
+                    'storageTypes': 'all'
+                })
+            driver.get("about:blank")
+            _DRIVER_POOL.put_nowait(driver)
+        except Exception:
+            # Pool full or disabled, or the browser is unusable
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    
     def _create_driver(self):
         """Create Chrome driver with Indeed-optimized settings"""
         chrome_options = Options()
@@ -153,29 +385,79 @@ class IndeedAssistant:
         chrome_options.add_argument("--disable-default-apps")
         
         # User agent to appear more human
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+        
+        # Bandwidth: the automation only reads text and clicks buttons, so
+        # skip images, fonts and plugins. Stylesheets stay on because the
+        # visibility checks depend on layout. Set INDEED_LOAD_IMAGES=1 to keep
+        # images (e.g. when a captcha needs solving by hand).
+        content_settings = {
+            'fonts': 2,  # Block fonts
+            'plugins': 2  # Block plugins
+        }
+        if os.environ.get('INDEED_LOAD_IMAGES', '').lower() not in ('1', 'true', 'yes'):
+            content_settings['images'] = 2  # Block images
+        chrome_options.add_experimental_option('prefs', {
+            f'profile.managed_default_content_settings.{name}': value
+            for name, value in content_settings.items()
+        })
+        
+        # Return from driver.get on DOMContentLoaded; explicit waits cover the rest
+        chrome_options.page_load_strategy = 'eager'
         
         driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(_get_chromedriver_path()),
             options=chrome_options
         )
         
-        # Hide automation indicators
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-        driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})")
+        # Hide automation indicators on every page the driver loads
+        # (registered once; Chrome re-runs it on each navigation)
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": (
+                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+                "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});"
+                "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});"
+            )
+        })
+        
+        # Drop ad/tracking requests at the network layer
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(self._BLOCKED_URL_PATTERNS)})
+        except Exception as e:
+            print(f"⚠️ INDEED: Could not set blocked URLs: {str(e)}")
         
         print("✅ INDEED: Chrome driver created successfully")
         return driver
     
+    def _find_first_visible(self, driver, selectors):
+        """Return the first visible element matching the selectors (in order), or None
+        
+        Runs in the browser in one round-trip; selectors the browser can't
+        parse (e.g. jQuery's :contains) are skipped.
+        """
+        return driver.execute_script(
+            self._VISIBLE_JS + "return firstVisible(arguments[0]);", list(selectors)
+        )
+    
+    def _wait_for_any(self, driver, selectors, timeout=10):
+        """Wait for the first visible element matching any selector; None on timeout"""
+        try:
+            return WebDriverWait(driver, timeout, ignored_exceptions=(StaleElementReferenceException,)).until(
+                lambda d: self._find_first_visible(d, selectors)
+            )
+        except TimeoutException:
+            return None
+    
     def _login_to_indeed(self, driver, wait):
         """Login to Indeed with email verification support - UPDATED FLOW"""
         try:
             print("🔐 INDEED: Navigating to login page...")
             
-            # Always start fresh on the login page
+            # Always start fresh on the login page, then wait for either the
+            # email field or (when already logged in) the account menu
             driver.get("https://secure.indeed.com/auth")
-            time.sleep(3)
+            self._wait_for_any(driver, self._EMAIL_SELECTORS + self._SUCCESS_SELECTORS)
             
             # Check if already logged in by looking for profile indicators
             if self._verify_login_success(driver):
@@ -185,22 +467,7 @@ class IndeedAssistant:
             # STEP 1: Enter email
             print("📧 INDEED: Entering email...")
             
-            email_selectors = [
-                "input[id='ifl-InputFormField-3']",
-                "input[type='email']",
-                "input[name='__email']",
-                "input[data-testid='email-input']"
-            ]
-            
-            email_input = None
-            for selector in email_selectors:
-                try:
-                    email_input = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    break
-                except:
-                    continue
+            email_input = self._wait_for_any(driver, self._EMAIL_SELECTORS)
             
             if not email_input:
                 print("❌ INDEED: Could not find email input field")
@@ -208,41 +475,24 @@ class IndeedAssistant:
             
             email_input.clear()
             email_input.send_keys(self.credentials.email)
-            time.sleep(1)
             
             # STEP 2: Click continue/next button
             print("🔄 INDEED: Clicking continue...")
-            continue_selectors = [
-                "button[type='submit']",
-                "button[data-tn-element='auth-page-email-submit-button']",
-                "button:contains('Continue')",
-                "button.dd-privacy-allow"
-            ]
-            
-            for selector in continue_selectors:
-                try:
-                    continue_btn = driver.find_element(By.CSS_SELECTOR, selector)
-                    if continue_btn.is_displayed():
-                        continue_btn.click()
-                        break
-                except:
-                    continue
+            continue_btn = self._find_first_visible(driver, self._CONTINUE_SELECTORS)
+            if continue_btn:
+                continue_btn.click()
             
-            time.sleep(3)
+            # Wait for the passkey screen's alternative sign-in link or the
+            # verification code input, whichever appears first
+            self._wait_for_any(driver, self._ALT_SIGNIN_SELECTORS + self._CODE_INPUT_SELECTORS)
             
             # STEP 3: Handle "Sign in with your passkey" screen
             print("🔑 INDEED: Looking for passkey screen...")
             
-            # Check if we're on the passkey screen
-            passkey_indicators = [
-                "sign in with your passkey",
-                "passkey",
-                "use your passkey",
-                "passwordless"
-            ]
-            
+            # Check if we're on the passkey screen (the page source is fetched
+            # once here and reused by the verification check below)
             page_source_lower = driver.page_source.lower()
-            on_passkey_screen = any(indicator in page_source_lower for indicator in passkey_indicators)
+            on_passkey_screen = bool(self._PASSKEY_RE.search(page_source_lower))
             
             if on_passkey_screen:
                 print("🔄 INDEED: Found passkey screen, looking for 'Sign in another way'...")
@@ -285,20 +535,24 @@ class IndeedAssistant:
                 
                 if not clicked:
                     print("❌ INDEED: Could not find 'Sign in another way' button")
-                    # Take a screenshot for debugging
-                    driver.save_screenshot("passkey_screen_debug.png")
+                    # Take a screenshot for debugging (INDEED_DEBUG only)
+                    self._save_debug_screenshot(driver, "passkey_screen_debug.jpg")
                     return False
                 
-                time.sleep(3)
+                # Wait for the verification code input to appear
+                self._wait_for_any(driver, self._CODE_INPUT_SELECTORS)
+                
+                # The page changed, so the cached source is stale
+                page_source_lower = None
             
             # STEP 4: Handle email verification code screen
             print("📧 INDEED: Checking for email verification screen...")
             
             # Check if we're now on the verification code screen
-            if not self._check_needs_verification(driver):
+            if not self._check_needs_verification(driver, page_source_lower, WebDriverWait(driver, 3)):
                 print("❌ INDEED: Expected email verification screen but didn't find it")
-                # Take a screenshot for debugging
-                driver.save_screenshot("after_passkey_debug.png")
+                # Take a screenshot for debugging (INDEED_DEBUG only)
+                self._save_debug_screenshot(driver, "after_passkey_debug.jpg")
                 return False
             
             # STEP 5: Get and enter verification code
@@ -306,9 +560,8 @@ class IndeedAssistant:
             if not self._handle_email_verification(driver, wait):
                 return False
             
-            # STEP 6: Verify login success
-            time.sleep(3)
-            if self._verify_login_success(driver):
+            # STEP 6: Verify login success (waiting for the account menu)
+            if self._verify_login_success(driver, WebDriverWait(driver, 10)):
                 print("✅ INDEED: Login successful!")
                 return True
             else:
@@ -317,48 +570,31 @@ class IndeedAssistant:
                 
         except Exception as e:
             print(f"❌ INDEED: Login error: {str(e)}")
-            # Take a screenshot for debugging
-            driver.save_screenshot("login_error_debug.png")
+            # Take a screenshot for debugging (INDEED_DEBUG only)
+            self._save_debug_screenshot(driver, "login_error_debug.jpg")
             return False
     
-    def _check_needs_verification(self, driver):
-        """Check if Indeed is asking for email verification"""
+    def _check_needs_verification(self, driver, page_source_lower=None, wait=None):
+        """Check if Indeed is asking for email verification
+        
+        page_source_lower: the lowercased page source if the caller already has it
+        wait: optional WebDriverWait to keep probing for the verification inputs
+        """
         try:
-            page_source = driver.page_source.lower()
-            verification_indicators = [
-                "verification code",
-                "verify your identity",
-                "we sent a code",
-                "enter the code",
-                "check your email",
-                "verification email",
-                "6-digit code",
-                "sign in code"
-            ]
-            
-            for indicator in verification_indicators:
-                if indicator in page_source:
-                    return True
+            if page_source_lower is None:
+                page_source_lower = driver.page_source.lower()
+            
+            if self._VERIFICATION_RE.search(page_source_lower):
+                return True
             
             # Also check for specific elements
-            verification_selectors = [
-                "input[aria-label*='verification']",
-                "input[aria-label*='code']",
-                "input[placeholder*='code']",
-                "[data-testid='verification-code-input']",
-                "input[maxlength='6']",
-                "input[type='text'][maxlength='6']"
-            ]
-            
-            for selector in verification_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and any(e.is_displayed() for e in elements):
-                        return True
-                except:
-                    continue
-                    
-            return False
+            if wait is None:
+                return self._find_first_visible(driver, self._VERIFICATION_SELECTORS) is not None
+            try:
+                wait.until(lambda d: self._find_first_visible(d, self._VERIFICATION_SELECTORS))
+                return True
+            except TimeoutException:
+                return False
             
         except:
             return False
@@ -369,9 +605,8 @@ class IndeedAssistant:
             if not EMAIL_VERIFICATION_AVAILABLE:
                 print("❌ INDEED: Email verification required but module not available")
                 print("💡 INDEED: Please enter the verification code manually")
-                print("⏳ INDEED: Waiting 60 seconds for manual code entry...")
-                time.sleep(60)
-                return True
+                print("⏳ INDEED: Waiting up to 60 seconds for manual code entry...")
+                return self._wait_for_manual_verification(driver, 60)
             
             print("📧 INDEED: Getting verification code from email...")
             
@@ -379,38 +614,17 @@ class IndeedAssistant:
             email_verifier = IndeedEmailVerification(self.credentials.email)
             
             # Get the verification code - pass driver and wait time
-            code = email_verifier.get_verification_code(driver, wait_time=60)
+            code = email_verifier.get_verification_code(driver, wait_time=self.verification_wait)
             
             if not code:
                 print("❌ INDEED: Could not retrieve verification code from email")
                 print("💡 INDEED: Please enter the code manually if you received it")
-                time.sleep(30)
-                return False
+                return self._wait_for_manual_verification(driver, 30)
             
             print(f"✅ INDEED: Retrieved verification code: {code}")
             
             # Find the code input field
-            code_input = None
-            code_selectors = [
-                "input[type='text'][maxlength='6']",
-                "input[aria-label*='verification']",
-                "input[aria-label*='code']",
-                "input[placeholder*='code']",
-                "input[name*='code']",
-                "[data-testid='verification-code-input']"
-            ]
-            
-            for selector in code_selectors:
-                try:
-                    inputs = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for inp in inputs:
-                        if inp.is_displayed():
-                            code_input = inp
-                            break
-                    if code_input:
-                        break
-                except:
-                    continue
+            code_input = self._find_first_visible(driver, self._CODE_INPUT_SELECTORS)
             
             if not code_input:
                 print("❌ INDEED: Could not find verification code input field")
@@ -421,142 +635,151 @@ class IndeedAssistant:
             code_input.send_keys(code)
             print("✅ INDEED: Entered verification code")
             
-            # Submit the code
-            submit_selectors = [
-                "button[type='submit']",
-                "button:contains('Verify')",
-                "button:contains('Submit')",
-                "button:contains('Continue')"
-            ]
+            # Submit the code: a visible submit button, otherwise the first
+            # visible button whose text says Verify / Submit / Continue (in
+            # that order) - found and clicked in the browser
+            clicked = driver.execute_script(self._VISIBLE_JS + """
+                const submit = Array.from(document.querySelectorAll("button[type='submit']")).find(isVisible);
+                if (submit) {
+                    submit.click();
+                    return true;
+                }
+                const buttons = Array.from(document.querySelectorAll('button')).filter(isVisible);
+                for (const word of ['verify', 'submit', 'continue']) {
+                    const button = buttons.find(function(b) {
+                        return (b.innerText || '').toLowerCase().includes(word);
+                    });
+                    if (button) {
+                        button.click();
+                        return true;
+                    }
+                }
+                return false;
+            """)
             
-            for selector in submit_selectors:
-                try:
-                    if selector.startswith("button:contains"):
-                        # Handle text-based selector
-                        buttons = driver.find_elements(By.TAG_NAME, "button")
-                        text_to_find = selector.split("'")[1]
-                        for button in buttons:
-                            if text_to_find.lower() in button.text.lower() and button.is_displayed():
-                                button.click()
-                                print("✅ INDEED: Submitted verification code")
-                                time.sleep(3)
-                                return True
-                    else:
-                        submit_btn = driver.find_element(By.CSS_SELECTOR, selector)
-                        if submit_btn.is_displayed():
-                            submit_btn.click()
-                            print("✅ INDEED: Submitted verification code")
-                            time.sleep(3)
-                            return True
-                except:
-                    continue
+            if clicked:
+                print("✅ INDEED: Submitted verification code")
+                return True
             
             # If no submit button found, try pressing Enter
             code_input.send_keys("\n")
             print("✅ INDEED: Submitted verification code via Enter key")
-            time.sleep(3)
             return True
             
         except Exception as e:
             print(f"❌ INDEED: Email verification error: {str(e)}")
             return False
     
-    def _verify_login_success(self, driver):
-        """Verify Indeed login was successful"""
+    def _save_debug_screenshot(self, driver, filename):
+        """Save a compressed JPEG screenshot via CDP, only when INDEED_DEBUG is set"""
+        if not self._debug:
+            return
+        try:
+            shot = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": 40})
+            with open(filename, "wb") as f:
+                f.write(base64.b64decode(shot['data']))
+            print(f"📸 INDEED: Saved debug screenshot to {filename}")
+        except Exception as e:
+            print(f"⚠️ INDEED: Could not save debug screenshot: {str(e)}")
+    
+    def _wait_for_manual_verification(self, driver, timeout):
+        """Wait until the verification screen goes away (code entered by hand); False on timeout"""
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=1).until(
+                lambda d: not self._check_needs_verification(d)
+            )
+            print("✅ INDEED: Verification completed manually")
+            return True
+        except TimeoutException:
+            print("❌ INDEED: Timed out waiting for manual verification")
+            return False
+    
+    def _verify_login_success(self, driver, wait=None):
+        """Verify Indeed login was successful
+        
+        wait: optional WebDriverWait to keep probing for the logged-in indicators
+        """
         try:
             # Check URL - successful login usually redirects away from auth page
             current_url = driver.current_url
             if 'secure.indeed.com/auth' in current_url:
-                # Still on login page, check for error messages
-                error_indicators = [
-                    "[data-testid='login-error']",
-                    ".error-message",
-                    "[role='alert']"
-                ]
-                for selector in error_indicators:
-                    try:
-                        error = driver.find_element(By.CSS_SELECTOR, selector)
-                        if error.is_displayed():
-                            print(f"❌ INDEED: Login error detected: {error.text}")
-                            return False
-                    except:
-                        continue
+                # Still on login page, check for error messages (the first
+                # visible one's text comes back in the same round-trip)
+                error_text = driver.execute_script(self._VISIBLE_JS + """
+                    const error = firstVisible(arguments[0]);
+                    return error ? error.innerText : null;
+                """, list(self._LOGIN_ERROR_SELECTORS))
+                if error_text is not None:
+                    print(f"❌ INDEED: Login error detected: {error_text}")
+                    return False
             
-            # Check for user menu or profile indicators
-            success_indicators = [
-                "div[data-gnav-element='profileMenu']",
-                "button[aria-label*='account']",
-                "a[href*='/myjobs']",
-                "span[class*='UserName']",
-                "button[id*='account-menu']",
-                "nav a[href*='/profile']"
-            ]
-            
-            for indicator in success_indicators:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, indicator)
-                    if element.is_displayed():
-                        return True
-                except:
-                    continue
-            
-            # Check page content for user email
-            page_text = driver.page_source
-            if self.credentials.email in page_text:
-                return True
-                
-            return False
+            # Check for user menu or profile indicators, then for the user's
+            # email in the page text - both in the browser, in one round-trip
+            def _logged_in(d):
+                return bool(d.execute_script(self._VISIBLE_JS + """
+                    if (firstVisible(arguments[0])) return true;
+                    const text = document.body ? document.body.innerText : '';
+                    return text.indexOf(arguments[1]) !== -1;
+                """, list(self._SUCCESS_SELECTORS), self.credentials.email))
+            
+            if wait is None:
+                return _logged_in(driver)
+            try:
+                return wait.until(_logged_in)
+            except TimeoutException:
+                return False
             
         except Exception as e:
             print(f"❌ INDEED: Login verification error: {str(e)}")
             return False
     
-    def _verify_job_results(self, driver):
-        """Verify we have job results on the page"""
+    def _verify_job_results(self, driver, wait=None):
+        """Verify we have job results on the page
+        
+        wait: optional WebDriverWait to allow the job cards time to render
+        """
         try:
-            # Multiple selectors for job cards
-            job_selectors = [
-                "[data-jk]",  # Job cards with data-jk attribute
-                ".jobsearch-SerpJobCard",  # Classic job card class
-                ".job_seen_beacon",  # New job card class
-                "[data-testid='job-card']",  # Test ID for job cards
-                "a[id^='job_']"  # Job links with ID pattern
-            ]
-            
-            job_cards = []
-            for selector in job_selectors:
-                try:
-                    cards = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if cards:
-                        job_cards.extend(cards)
-                        break
-                except:
-                    continue
-            
-            if job_cards:
-                # Filter for visible cards
-                visible_cards = [card for card in job_cards if card.is_displayed()]
-                print(f"✅ INDEED: Found {len(visible_cards)} job listings")
-                return len(visible_cards) > 0
-            
-            # Check for "no results" message
-            no_results_indicators = [
-                "[class*='no-results']",
-                "[class*='jobsearch-NoResult']",
-                "div:contains('No jobs found')"
-            ]
-            
-            for indicator in no_results_indicators:
+            # Count visible cards for the first selector that has any, in the
+            # browser (one round-trip, one integer back). Selectors whose
+            # matches are all hidden (templates, skeletons) are skipped; -1
+            # means none had visible cards but a "no results" message shows
+            def _count_cards(d):
+                return d.execute_script(self._VISIBLE_JS + """
+                    for (const s of arguments[0]) {
+                        let cards;
+                        try {
+                            cards = document.querySelectorAll(s);
+                        } catch (e) {
+                            continue;
+                        }
+                        const n = Array.from(cards).filter(isVisible).length;
+                        if (n) return n;
+                    }
+                    return firstVisible(arguments[1]) ? -1 : 0;
+                """, list(self._JOB_CARD_SELECTORS), list(self._NO_RESULTS_SELECTORS))
+            
+            def _cards_rendered(d):
+                # Wrapped in a tuple so a "no results" answer (-1) also ends the wait
+                count = _count_cards(d)
+                return (count,) if count else None
+            
+            if wait is None:
+                visible_count = _count_cards(driver)
+            else:
                 try:
-                    no_results = driver.find_element(By.CSS_SELECTOR, indicator)
-                    if no_results.is_displayed():
-                        print("❌ INDEED: No results message found")
-                        return False
-                except:
-                    continue
-                    
+                    visible_count, = wait.until(_cards_rendered)
+                except TimeoutException:
+                    visible_count = 0
+            
+            if visible_count > 0:
+                print(f"✅ INDEED: Found {visible_count} job listings")
+                return True
+            
+            if visible_count < 0:
+                print("❌ INDEED: No results message found")
+                
             return False
             
         except Exception as e:
             print(f"❌ INDEED: Error verifying job results: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -5,14 +5,21 @@ import threading
 import json
 from datetime import datetime
 import importlib
+import importlib.util
 import sys
-import random
-import string
+import base64
+import queue
+import atexit
+import weakref
+import uuid
+import logging
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import database-related modules
 try:
-    import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import RealDictCursor, execute_values
+    from psycopg2.pool import ThreadedConnectionPool
     DB_AVAILABLE = True
 except ImportError:
     DB_AVAILABLE = False
@@ -24,12 +31,57 @@ try:
 except ImportError:
     print("⚠️ python-dotenv not available - using system environment variables")
 
+# Database messages go through a logger so the per-request success lines
+# can be silenced (JBA_LOG_LEVEL, default INFO; they are logged at DEBUG).
+# It writes to stdout, the same stream as the print banners
+logger = logging.getLogger('jba')
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(os.getenv('JBA_LOG_LEVEL', 'INFO').upper())
+    logger.propagate = False
+
+# Columns read for each job board; rows are zipped straight into dicts
+_BOARD_COLUMNS = (
+    'id', 'site_name', 'site_url', 'agency_name', 'industry',
+    'agency_rating', 'automation_script', 'is_active',
+    'date_added', 'last_tested', 'success_rate'
+)
+
+# Read queries, prepared once per pooled connection and run with EXECUTE
+_PREPARED_STATEMENTS = {
+    'jba_industries': """
+        SELECT DISTINCT industry FROM job_board_sites WHERE is_active = true ORDER BY industry
+    """,
+    'jba_boards_by_industry': f"""
+        SELECT {', '.join(_BOARD_COLUMNS)}
+        FROM job_board_sites 
+        WHERE industry = $1 AND is_active = true
+        ORDER BY success_rate DESC NULLS LAST, site_name
+        LIMIT $2
+    """,
+    'jba_user_by_email': """
+        SELECT id, email, first_name, last_name, phone, 
+               address, city, state, zip_code, country,
+               tier, created_at, is_active
+        FROM users 
+        WHERE email = $1
+    """
+}
+
+def _generate_app_ref():
+    """8-character uppercase/digit application reference (5 random bytes, base32)"""
+    return base64.b32encode(os.urandom(5)).decode('ascii')
+
 class JobBoardAssistant:
     """Job Board Assistant - Industry-based orchestrator with subscription management"""
     
     def __init__(self):
         self.name = "Job Board Assistant"
-        self.stop_requested = False
+        
+        # Stop signal per running orchestration: {submission_id: (user_email, threading.Event)}
+        self._stop_events = {}
         
         # Subscription tier limits (weekly job board submissions)
         self.tier_limits = {
@@ -38,14 +90,66 @@ class JobBoardAssistant:
             'premium': {'weekly_submissions': 50, 'max_boards_per_session': 10}
         }
         
-        # Load industry assistants
+        # Per-session board caps and their limit messages, precomputed per tier
+        self._tier_max_boards = {
+            tier: limits['max_boards_per_session'] for tier, limits in self.tier_limits.items()
+        }
+        self._tier_err = {
+            tier: f"Your {tier} tier allows maximum {cap} boards per session"
+            for tier, cap in self._tier_max_boards.items()
+        }
+        
+        # Connection settings, read from the environment once
+        self._db_config = {
+            'host': os.getenv('DB_HOST', 'localhost'),
+            'database': os.getenv('DB_NAME', 'interview_connect'),
+            'user': os.getenv('DB_USER', 'InConAdmin'),
+            'password': os.getenv('DB_PASSWORD', ''),
+            'port': os.getenv('DB_PORT', '5432')
+        }
+        
+        # Shared connection pool; created here, or on first use if the
+        # database was unreachable at startup
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._create_pool()
+        # Pooled connections that already have _PREPARED_STATEMENTS
+        self._prepared_conns = weakref.WeakKeyDictionary()
+        
+        # Active industries rarely change, so cache them for INDUSTRIES_TTL seconds
+        self._industries_cache = (0.0, None)
+        self._industries_ttl = int(os.getenv('INDUSTRIES_TTL', '300'))
+        self._industries_lock = threading.Lock()
+        
+        # Active boards per industry, cached for a minute: {(industry, limit): (timestamp, boards)}
+        self._boards_cache = {}
+        self._boards_lock = threading.Lock()
+        
+        # Submission rows are written by one background thread, which
+        # coalesces everything queued into a single INSERT
+        self._write_queue = queue.Queue(maxsize=1000)
+        if DB_AVAILABLE:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name='jba-writer', daemon=True)
+            self._writer_thread.start()
+            atexit.register(self._stop_writer)
+        
+        # Orchestrations run on a bounded, reused set of worker threads
+        self._orchestration_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv('ORCH_WORKERS', '8')),
+            thread_name_prefix='jba-orch'
+        )
+        
+        # Register industry assistants; each module is imported on first use
+        # and its class cached in _class_cache
         self.industry_assistants = self._load_industry_assistants()
+        self._class_cache = {}
+        self._class_cache_lock = threading.Lock()
         
         print(f"✅ {self.name} Orchestrator initialized")
         print(f"Available industry assistants: {list(self.industry_assistants.keys())}")
 
     def _load_industry_assistants(self):
-        """Load all available industry assistant modules"""
+        """Map each industry with an assistant module on disk to (module_name, class_name), without importing it"""
         assistants = {}
         
         # Add the current directory to Python path if not already there
@@ -70,16 +174,14 @@ class JobBoardAssistant:
         
         for industry, module_name in industry_modules.items():
             try:
-                # Try to import the module from job_board_assistant subdirectory
-                module = importlib.import_module(f"job_board_assistant.{module_name}")
-                
-                # Get the assistant class (assumes class name follows pattern)
-                class_name = f"{industry}Assistant"
-                if hasattr(module, class_name):
-                    assistants[industry] = (f"job_board_assistant.{module_name}", class_name)
-                    print(f"✅ Loaded {industry} assistant")
+                # Locate the module in the job_board_assistant subdirectory (finding
+                # it doesn't run it; the import happens in _get_industry_assistant)
+                full_name = f"job_board_assistant.{module_name}"
+                if importlib.util.find_spec(full_name) is not None:
+                    # Assistant class name follows the "<Industry>Assistant" pattern
+                    assistants[industry] = (full_name, f"{industry}Assistant")
                 else:
-                    print(f"⚠️ {industry} assistant class not found in {module_name}")
+                    print(f"⚠️ Could not load {industry} assistant: {module_name} not found")
                     
             except ImportError as e:
                 print(f"⚠️ Could not load {industry} assistant: {module_name} - {str(e)}")
@@ -88,194 +190,254 @@ class JobBoardAssistant:
         
         return assistants
 
+    def _create_pool(self):
+        """Create the shared database connection pool"""
+        if not DB_AVAILABLE:
+            return None
+        
+        with self._pool_lock:
+            if self._pool is None:
+                try:
+                    self._pool = ThreadedConnectionPool(
+                        minconn=2,
+                        maxconn=int(os.getenv('DB_POOL_MAX', '20')),
+                        **self._db_config
+                    )
+                except Exception as e:
+                    logger.error("❌ Database connection error: %s", e)
+        return self._pool
+
     def get_db_connection(self):
-        """Get database connection"""
+        """Get a database connection from the pool (return it with self._pool.putconn)"""
         if not DB_AVAILABLE:
-            print("❌ Database not available")
+            logger.error("❌ Database not available")
             return None
             
         try:
-            db_config = {
-                'host': os.getenv('DB_HOST', 'localhost'),
-                'database': os.getenv('DB_NAME', 'interview_connect'),
-                'user': os.getenv('DB_USER', 'InConAdmin'),
-                'password': os.getenv('DB_PASSWORD', ''),
-                'port': os.getenv('DB_PORT', '5432')
-            }
-            return psycopg2.connect(**db_config)
+            pool = self._pool or self._create_pool()
+            return pool.getconn() if pool else None
         except Exception as e:
-            print(f"❌ Database connection error: {str(e)}")
+            logger.error("❌ Database connection error: %s", e)
             return None
 
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection (None if unavailable)
+
+        Writes run inside `with conn:`, which commits or rolls back; putconn
+        rolls back anything still open (e.g. a failed read) before reuse.
+        """
+        conn = self.get_db_connection()
+        try:
+            if conn and conn not in self._prepared_conns:
+                self._prepare_statements(conn)
+            yield conn
+        finally:
+            if conn:
+                self._pool.putconn(conn)
+
+    def _prepare_statements(self, conn):
+        """PREPARE the read queries on a connection the first time it is borrowed"""
+        with conn, conn.cursor() as cur:
+            for name, query in _PREPARED_STATEMENTS.items():
+                cur.execute(f"PREPARE {name} AS {query}")
+        self._prepared_conns[conn] = True
+
     def get_available_industries(self):
         """Get list of available industries"""
         default_industries = ['Manufacturing', 'Healthcare', 'Technology', 'Finance', 'Retail']
         
         if not DB_AVAILABLE:
             return default_industries
+        
+        with self._industries_lock:
+            cached_at, cached = self._industries_cache
+            if cached is not None and time.monotonic() - cached_at < self._industries_ttl:
+                return cached
             
-        try:
-            conn = self.get_db_connection()
-            if not conn:
-                return default_industries
+            try:
+                with self._conn() as conn:
+                    if not conn:
+                        return default_industries
+                        
+                    cur = conn.cursor()
+                    cur.execute("EXECUTE jba_industries")
+                    industries = [row[0] for row in cur.fetchall()]
                 
-            cur = conn.cursor()
-            cur.execute("SELECT DISTINCT industry FROM job_board_sites WHERE is_active = true ORDER BY industry")
-            industries = [row[0] for row in cur.fetchall()]
-            conn.close()
-            
-            return industries if industries else default_industries
-            
-        except Exception as e:
-            print(f"❌ Error getting industries: {str(e)}")
-            return default_industries
+                if not industries:
+                    return default_industries
+                
+                self._industries_cache = (time.monotonic(), industries)
+                return industries
+                
+            except Exception as e:
+                logger.error("❌ Error getting industries: %s", e)
+                return default_industries
 
-    def get_boards_for_industry(self, industry):
-        """Get job boards for a specific industry from database"""
+    def get_boards_for_industry(self, industry, limit=None):
+        """Get job boards for a specific industry from database (best success rate first, at most limit)"""
         if not DB_AVAILABLE:
-            print("❌ Database not available")
+            logger.error("❌ Database not available")
             return []
             
-        try:
-            conn = self.get_db_connection()
-            if not conn:
-                return []
-                
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-            
-            # Query job boards for specific industry using actual column names
-            query = """
-                SELECT id, site_name, site_url, agency_name, industry, 
-                       agency_rating, automation_script, is_active, 
-                       date_added, last_tested, success_rate
-                FROM job_board_sites 
-                WHERE industry = %s AND is_active = true
-                ORDER BY site_name
-            """
-            
-            cur.execute(query, (industry,))
-            boards = cur.fetchall()
-            conn.close()
+        with self._boards_lock:
+            cached = self._boards_cache.get((industry, limit))
+            if cached and time.monotonic() - cached[0] < 60:
+                # Callers get their own list; the board dicts are shared read-only
+                return list(cached[1])
             
-            # Convert to list of dicts
-            boards_list = [dict(board) for board in boards]
-            
-            print(f"Found {len(boards_list)} boards for {industry} industry")
-            return boards_list
+            try:
+                with self._conn() as conn:
+                    if not conn:
+                        return []
+                    
+                    cur = conn.cursor()
+                    
+                    # Query job boards for specific industry (see _PREPARED_STATEMENTS)
+                    cur.execute("EXECUTE jba_boards_by_industry(%s, %s)", (industry, limit))
+                    boards = cur.fetchall()
+                
+                # Convert tuple rows to dicts in one pass (the industry
+                # assistants read boards with .get)
+                boards_list = [dict(zip(_BOARD_COLUMNS, board)) for board in boards]
+                self._boards_cache[(industry, limit)] = (time.monotonic(), boards_list)
+                
+                logger.debug("Found %s boards for %s industry", len(boards_list), industry)
+                return list(boards_list)
             
-        except Exception as e:
-            print(f"❌ Database error getting boards: {str(e)}")
-            return []
+            except Exception as e:
+                logger.error("❌ Database error getting boards: %s", e)
+                return []
+
+    def _normalize_tier(self, user_tier):
+        """Lowercase tier name, falling back to basic for missing or unknown tiers"""
+        user_tier = (user_tier or 'basic').lower()
+        return user_tier if user_tier in self.tier_limits else 'basic'
 
     def check_tier_limits(self, user_tier, selected_boards_count):
         """Check if user can submit to selected number of boards based on tier"""
-        # Normalize tier name to lowercase
-        user_tier = user_tier.lower() if user_tier else 'basic'
-        if user_tier not in self.tier_limits:
-            user_tier = 'basic'
-        
-        limits = self.tier_limits[user_tier]
-        
-        # Check max boards per session
-        if selected_boards_count > limits['max_boards_per_session']:
-            return False, f"Your {user_tier} tier allows maximum {limits['max_boards_per_session']} boards per session"
-        
-        return True, "Within limits"
+        user_tier = self._normalize_tier(user_tier)
+        if selected_boards_count <= self._tier_max_boards[user_tier]:
+            return True, "Within limits"
+        return False, self._tier_err[user_tier]
     
     def get_user_profile_from_db(self, user_email):
         """Get complete user profile from database"""
         if not DB_AVAILABLE:
-            print("❌ Database not available")
+            logger.error("❌ Database not available")
             return None
             
         try:
-            conn = self.get_db_connection()
-            if not conn:
-                return None
+            with self._conn() as conn:
+                if not conn:
+                    return None
+                    
+                cur = conn.cursor(cursor_factory=RealDictCursor)
                 
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-            
-            # Query ALL user data from users table
-            cur.execute("""
-                SELECT id, email, first_name, last_name, phone, 
-                       address, city, state, zip_code, country,
-                       tier, created_at, is_active
-                FROM users 
-                WHERE email = %s
-            """, (user_email,))
-            
-            user_data = cur.fetchone()
-            conn.close()
+                # Query ALL user data from users table
+                cur.execute("EXECUTE jba_user_by_email(%s)", (user_email,))
+                
+                user_data = cur.fetchone()
             
             if user_data:
-                user_profile = dict(user_data)
-                print(f"✅ Retrieved user profile for {user_email}")
-                return user_profile
+                # RealDictRow is already a dict subclass, so no copy is needed
+                logger.debug("✅ Retrieved user profile for %s", user_email)
+                return user_data
             else:
-                print(f"❌ No user found with email: {user_email}")
+                logger.warning("❌ No user found with email: %s", user_email)
                 return None
                 
         except Exception as e:
-            print(f"❌ Database error getting user profile: {str(e)}")
+            logger.error("❌ Database error getting user profile: %s", e)
             return None
 
     def record_board_submissions(self, user_email, industry, boards):
-        """Record job board submissions to database"""
+        """Queue job board submissions to be recorded in the database"""
+        rows = [
+            (
+                user_email,
+                _generate_app_ref(),
+                f"job-board-{board['site_name'].lower().replace(' ', '-')}",
+                f"{industry} Position",
+                board.get('agency_name', 'Agency'),
+                'submitted'
+            )
+            for board in boards
+        ]
+        return self._queue_submissions(rows)
+
+    def _queue_submissions(self, rows):
+        """Hand submission rows (email, app_ref, platform, job_title, company, status) to the writer"""
         if not DB_AVAILABLE:
-            print("⚠️ Database not available - cannot record submissions")
+            logger.warning("⚠️ Database not available - cannot record submissions")
             return False
-            
+        
         try:
-            conn = self.get_db_connection()
-            if not conn:
-                return False
-                
-            cur = conn.cursor()
-            
-            # Get user_id
-            cur.execute("SELECT id FROM users WHERE email = %s", (user_email,))
-            user_result = cur.fetchone()
+            self._write_queue.put(rows, timeout=5)
+            return True
+        except queue.Full:
+            logger.error("❌ Submission queue full - dropped %s submission records", len(rows))
+            return False
+
+    def _writer_loop(self):
+        """Drain the submission queue, writing each drained batch in one INSERT"""
+        while True:
+            batch = [self._write_queue.get()]
             
-            if not user_result:
-                print(f"❌ User not found: {user_email}")
-                conn.close()
-                return False
+            # Pick up anything else queued meanwhile (a None entry means stop)
+            while batch[-1] is not None and len(batch) < 200:
+                try:
+                    batch.append(self._write_queue.get(timeout=0.5))
+                except queue.Empty:
+                    break
             
-            user_id = user_result[0]
+            rows = [row for item in batch if item is not None for row in item]
+            if rows:
+                self._write_submissions(rows)
             
-            # Record each board submission
-            for board in boards:
-                app_ref = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+            if batch[-1] is None:
+                return
+
+    def _write_submissions(self, rows):
+        """Insert submission rows for any number of users in one statement"""
+        try:
+            with self._conn() as conn:
+                if not conn:
+                    logger.error("❌ Database unavailable - dropped %s submission records", len(rows))
+                    return
+                    
+                # The join on users resolves user_id, so rows for unknown
+                # emails are simply not inserted
+                with conn, conn.cursor() as cur:
+                    inserted = execute_values(cur, """
+                        INSERT INTO application_stats 
+                        (user_id, app_ref, platform, job_title, company, status, date_applied, submitted_at)
+                        SELECT u.id, v.app_ref, v.platform, v.job_title, v.company, v.status, CURRENT_DATE, NOW()
+                        FROM users u
+                        JOIN (VALUES %s) AS v(email, app_ref, platform, job_title, company, status) ON u.email = v.email
+                        RETURNING 1
+                    """, rows, page_size=100, fetch=True)
                 
-                cur.execute("""
-                    INSERT INTO application_stats 
-                    (user_id, app_ref, platform, job_title, company, status, date_applied, submitted_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, CURRENT_DATE, NOW())
-                """, (
-                    user_id, 
-                    app_ref, 
-                    f"job-board-{board['site_name'].lower().replace(' ', '-')}", 
-                    f"{industry} Position",
-                    board.get('agency_name', 'Agency'),
-                    'submitted'
-                ))
-            
-            conn.commit()
-            print(f"✅ Recorded {len(boards)} job board submissions for {user_email}")
-            conn.close()
-            return True
+                logger.debug("✅ Recorded %s job board submissions", len(inserted))
+                if len(inserted) < len(rows):
+                    logger.warning("❌ Skipped %s submissions for unknown users", len(rows) - len(inserted))
             
         except Exception as e:
-            print(f"❌ Error recording submissions: {str(e)}")
-            if conn:
-                conn.rollback()
-                conn.close()
-            return False
+            logger.error("❌ Error recording submissions: %s", e)
+
+    def _stop_writer(self):
+        """Flush queued submissions at interpreter exit"""
+        try:
+            self._write_queue.put(None, timeout=1)
+            self._writer_thread.join(timeout=10)
+        except queue.Full:
+            pass
 
     def start_automation(self, request, session):
         """Start Job Board Assistant orchestration"""
         user_email = session.get('user_email', '')
         user_tier = session.get('user_tier', 'basic')
+        user_tier_lc = self._normalize_tier(user_tier)
         
         if not user_email:
             return jsonify({
@@ -315,8 +477,9 @@ class JobBoardAssistant:
                 'message': f'No automation available for {selected_industry} industry yet.'
             }), 400
         
-        # Get available boards for industry
-        available_boards = self.get_boards_for_industry(selected_industry)
+        # Get available boards for industry, no more than the tier allows per session
+        max_boards = self._tier_max_boards[user_tier_lc]
+        available_boards = self.get_boards_for_industry(selected_industry, max_boards)
         
         if not available_boards:
             return jsonify({
@@ -324,26 +487,19 @@ class JobBoardAssistant:
                 'message': f'No active boards found for {selected_industry} industry in database.'
             }), 400
         
-        # For now, select all available boards
+        # For now, select all available boards (the query above already
+        # caps them at the tier's per-session limit)
         selected_boards = available_boards
         
-        # Check tier limits
-        can_proceed, limit_message = self.check_tier_limits(user_tier, len(selected_boards))
-        if not can_proceed:
-            return jsonify({
-                'status': 'error',
-                'message': limit_message,
-                'selected_count': len(selected_boards),
-                'tier_limits': self.tier_limits[user_tier.lower()]
-            }), 400
-        
         print(f"\n✅ Job Board Assistant Orchestrator started")
         print(f"User: {user_email} (ID: {user_id}, Tier: {user_tier})")
         print(f"Industry: {selected_industry}")
         print(f"Selected Boards: {', '.join([b['site_name'] for b in selected_boards])}")
         
-        # Reset stop flag
-        self.stop_requested = False
+        # Stop signal for this run only
+        submission_id = uuid.uuid4().hex
+        stop_event = threading.Event()
+        self._stop_events[submission_id] = (user_email, stop_event)
         
         # Create session data with complete user profile
         session_data = {
@@ -367,24 +523,24 @@ class JobBoardAssistant:
             if resume_file and resume_file.filename:
                 # Save resume file
                 os.makedirs('uploads', exist_ok=True)
-                resume_filename = f"resume_{user_email.replace('@', '_')}_{int(time.time())}.{resume_file.filename.split('.')[-1]}"
+                ext = os.path.splitext(resume_file.filename)[1]
+                resume_filename = f"resume_{user_email.replace('@', '_')}_{int(time.time())}{ext}"
                 resume_path = os.path.join('uploads', resume_filename)
                 resume_file.save(resume_path)
                 session_data['resume_path'] = resume_path
                 print(f"📄 Resume uploaded: {resume_filename}")
         
         # Start background automation
-        automation_thread = threading.Thread(
-            target=self._run_industry_orchestration,
-            args=(user_email, selected_industry, selected_boards, session_data)
+        self._orchestration_pool.submit(
+            self._run_industry_orchestration,
+            user_email, selected_industry, selected_boards, session_data, submission_id, stop_event
         )
-        automation_thread.daemon = True
-        automation_thread.start()
         
         return jsonify({
             'status': 'success',
             'message': f'Job Board Assistant started for {selected_industry} industry!',
             'data': {
+                'submission_id': submission_id,
                 'industry': selected_industry,
                 'boards_count': len(selected_boards),
                 'boards': [{'id': b['id'], 'name': b['site_name']} for b in selected_boards],
@@ -393,16 +549,34 @@ class JobBoardAssistant:
             }
         })
 
-    def stop_automation(self):
-        """Stop the automation process"""
-        self.stop_requested = True
-        print("✅ Stop requested for Job Board Assistant Orchestrator")
+    def stop_automation(self, submission_id=None, user_email=None):
+        """Stop one of the user's orchestrations by submission id, or all of the user's runs if no id is given"""
+        if not user_email:
+            return jsonify({
+                'status': 'error',
+                'message': 'User not logged in'
+            }), 400
+        
+        if submission_id:
+            owner, stop_event = self._stop_events.get(submission_id, (None, None))
+            if stop_event is None or owner != user_email:
+                return jsonify({
+                    'status': 'error',
+                    'message': 'No running Job Board Assistant with that submission id'
+                }), 404
+            stop_event.set()
+        else:
+            for owner, stop_event in list(self._stop_events.values()):
+                if owner == user_email:
+                    stop_event.set()
+        
+        print(f"✅ Stop requested for Job Board Assistant Orchestrator ({submission_id or f'all runs for {user_email}'})")
         return jsonify({
             'status': 'success',
             'message': 'Stop signal sent to Job Board Assistant'
         })
 
-    def _run_industry_orchestration(self, user_email, industry, selected_boards, session_data):
+    def _run_industry_orchestration(self, user_email, industry, selected_boards, session_data, submission_id, stop_event):
         """Orchestrate industry-specific assistant execution"""
         try:
             print(f"\n{'='*60}")
@@ -422,11 +596,12 @@ class JobBoardAssistant:
                 return
             
             # Set up the assistant
-            industry_assistant.set_stop_flag_reference(self)
+            industry_assistant.set_stop_flag_reference(stop_event)
             industry_assistant.set_selected_boards(selected_boards)
             
-            # Start the industry-specific automation with complete user data
-            result = industry_assistant.start_automation(session_data)
+            # Run the industry-specific automation with complete user data on
+            # this pool worker, so ORCH_WORKERS bounds the board runs themselves
+            result = industry_assistant.start_automation(session_data, background=False)
             
             if result.get('success'):
                 print(f"\n✅ {industry} assistant completed successfully")
@@ -438,28 +613,10 @@ class JobBoardAssistant:
                 print(f"\n❌ {industry} assistant failed: {result.get('message')}")
                 
                 # Record failed submissions
-                if DB_AVAILABLE:
-                    try:
-                        conn = self.get_db_connection()
-                        if conn:
-                            cur = conn.cursor()
-                            cur.execute("SELECT id FROM users WHERE email = %s", (user_email,))
-                            user_result = cur.fetchone()
-                            
-                            if user_result:
-                                user_id = user_result[0]
-                                # Record single failed entry
-                                app_ref = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-                                cur.execute("""
-                                    INSERT INTO application_stats 
-                                    (user_id, app_ref, platform, job_title, company, status, date_applied, submitted_at)
-                                    VALUES (%s, %s, %s, %s, %s, %s, CURRENT_DATE, NOW())
-                                """, (user_id, app_ref, f"job-board-{industry.lower()}", 
-                                     f"{industry} Position", "Multiple", 'failed'))
-                                conn.commit()
-                            conn.close()
-                    except Exception as e:
-                        print(f"⚠️ Could not record failed submission: {str(e)}")
+                self._queue_submissions([
+                    (user_email, _generate_app_ref(), f"job-board-{industry.lower()}",
+                     f"{industry} Position", "Multiple", 'failed')
+                ])
             
             print(f"\n{'='*60}")
             print(f"ORCHESTRATION COMPLETE")
@@ -473,42 +630,30 @@ class JobBoardAssistant:
             traceback.print_exc()
             
             # Try to record error in database
-            if DB_AVAILABLE:
-                try:
-                    conn = self.get_db_connection()
-                    if conn:
-                        cur = conn.cursor()
-                        cur.execute("SELECT id FROM users WHERE email = %s", (user_email,))
-                        user_result = cur.fetchone()
-                        
-                        if user_result:
-                            user_id = user_result[0]
-                            app_ref = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-                            cur.execute("""
-                                INSERT INTO application_stats 
-                                (user_id, app_ref, platform, job_title, company, status, date_applied, submitted_at)
-                                VALUES (%s, %s, %s, %s, %s, %s, CURRENT_DATE, NOW())
-                            """, (user_id, app_ref, f"job-board-{industry.lower()}", 
-                                 f"{industry} Position - Error", str(e)[:100], 'failed'))
-                            conn.commit()
-                        conn.close()
-                except:
-                    pass
+            self._queue_submissions([
+                (user_email, _generate_app_ref(), f"job-board-{industry.lower()}",
+                 f"{industry} Position - Error", str(e)[:100], 'failed')
+            ])
+        finally:
+            # Boards run inline above, so the run is really over here
+            self._stop_events.pop(submission_id, None)
 
     def _get_industry_assistant(self, industry):
         """Get the appropriate industry assistant instance"""
-        if industry not in self.industry_assistants:
+        registered = self.industry_assistants.get(industry)
+        if registered is None:
             print(f"⚠️ No assistant registered for {industry}")
             return None
         
         try:
-            module_name, class_name = self.industry_assistants[industry]
-            
-            # Import the module from job_board_assistant subdirectory
-            module = importlib.import_module(module_name)
-            
-            # Get the class
-            assistant_class = getattr(module, class_name)
+            with self._class_cache_lock:
+                assistant_class = self._class_cache.get(industry)
+                if assistant_class is None:
+                    # First use: import the module and keep the class
+                    module_name, class_name = registered
+                    assistant_class = getattr(importlib.import_module(module_name), class_name)
+                    self._class_cache[industry] = assistant_class
+                    print(f"✅ Loaded {industry} assistant")
             
             # Create instance
             assistant_instance = assistant_class()
@@ -1,11 +1,12 @@
 import os
-import time
 import threading
 import importlib
+import importlib.util
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 class HealthcareAssistant:
-    """Healthcare Industry Job Board Assistant - Runs automations sequentially"""
+    """Healthcare Industry Job Board Assistant - Runs automations in parallel"""
     
     def __init__(self):
         self.name = "Healthcare Assistant"
@@ -28,33 +29,40 @@ class HealthcareAssistant:
             print(f"Warning: website_automation directory not found at {automation_dir}")
             return modules_map
         
-        # Add the parent directory to Python path for proper imports
-        parent_dir = os.path.dirname(current_dir)
-        if parent_dir not in sys.path:
-            sys.path.insert(0, parent_dir)
+        # Attributes that mark a class as a website automation
+        required = ('HANDLES_SITE', 'submit_application')
         
-        # Add current directory to path as well
-        if current_dir not in sys.path:
-            sys.path.insert(0, current_dir)
-        
-        # Scan for automation modules
-        for filename in os.listdir(automation_dir):
-            if filename.endswith('_automation.py') and filename != '__init__.py':
-                module_name = filename[:-3]  # Remove .py
+        # Scan for automation modules (DirEntry type info comes from the
+        # directory read itself, so there is no stat per entry)
+        with os.scandir(automation_dir) as entries:
+            for entry in entries:
+                if not (entry.is_file(follow_symlinks=False) and
+                        entry.name.endswith('_automation.py') and entry.name != '__init__.py'):
+                    continue
+                module_name = entry.name[:-3]  # Remove .py
                 
                 try:
-                    # Import the module
+                    # Load the module straight from the scanned file (no sys.path
+                    # search), reusing it if another assistant already loaded it
                     full_module_name = f"job_board_assistant.website_automation.{module_name}"
-                    module = importlib.import_module(full_module_name)
+                    module = sys.modules.get(full_module_name)
+                    if module is None:
+                        spec = importlib.util.spec_from_file_location(full_module_name, entry.path)
+                        module = importlib.util.module_from_spec(spec)
+                        sys.modules[full_module_name] = module
+                        try:
+                            spec.loader.exec_module(module)
+                        except BaseException:
+                            del sys.modules[full_module_name]
+                            raise
                     
                     # Look for automation classes with HANDLES_SITE attribute
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (isinstance(attr, type) and 
-                            hasattr(attr, 'HANDLES_SITE') and 
-                            hasattr(attr, 'submit_application')):
+                    # (class __dict__ first; hasattr only for inherited ones)
+                    for attr_name, attr in vars(module).items():
+                        if (isinstance(attr, type) and
+                            all(a in attr.__dict__ or hasattr(attr, a) for a in required)):
                             site_name = attr.HANDLES_SITE
-                            modules_map[site_name] = (full_module_name, attr_name)
+                            modules_map[site_name] = attr
                             print(f"Found automation: {attr_name} handles '{site_name}'")
                             
                 except Exception as e:
@@ -64,21 +72,26 @@ class HealthcareAssistant:
         
         return modules_map
     
-    def set_stop_flag_reference(self, orchestrator):
-        """Set reference to orchestrator's stop flag"""
-        self.stop_flag_ref = orchestrator
+    def set_stop_flag_reference(self, stop_event):
+        """Set the threading.Event that signals a stop for this orchestration"""
+        self.stop_flag_ref = stop_event
+    
+    def _is_stopped(self):
+        """True once a stop has been requested for this orchestration"""
+        ref = self.stop_flag_ref
+        return ref is not None and ref.is_set()
     
     def set_selected_boards(self, boards):
         """Set the boards selected for this industry"""
         self.selected_boards = boards
         self.completed_boards.clear()  # Reset completed boards for new session
     
-    def start_automation(self, session_data):
-        """Start Healthcare-specific automation"""
+    def start_automation(self, session_data, background=True):
+        """Start Healthcare-specific automation (inline when background is False)"""
         print(f"Starting {self.name} automation")
         
         # Check stop flag before processing
-        if self.stop_flag_ref and self.stop_flag_ref.stop_requested:
+        if self._is_stopped():
             return {'success': False, 'message': 'Stopped by user'}
         
         try:
@@ -104,7 +117,16 @@ class HealthcareAssistant:
             
             print(f"User Profile: {user_profile['first_name']} {user_profile['last_name']} ({user_profile['email']})")
             
-            # Run automation in separate thread
+            # Run automation in separate thread, or on the caller's thread
+            # (the orchestrator already runs this on a bounded worker pool)
+            if not background:
+                self._run_Healthcare_automation(self.selected_boards, user_profile)
+                return {
+                    'success': True,
+                    'message': f'{self.name} finished {len(self.selected_boards)} boards',
+                    'boards_count': len(self.selected_boards)
+                }
+            
             automation_thread = threading.Thread(
                 target=self._run_Healthcare_automation,
                 args=(self.selected_boards, user_profile)
@@ -125,7 +147,8 @@ class HealthcareAssistant:
             return {'success': False, 'error': str(e)}
     
     def _run_Healthcare_automation(self, boards, user_profile):
-        """Run automation for all Healthcare job boards sequentially"""
+        """Run automation for all Healthcare job boards in parallel"""
+        is_stopped = self._is_stopped
         results = {}
         successful_submissions = 0
         
@@ -136,56 +159,30 @@ class HealthcareAssistant:
             print(f"Boards to process: {len(boards)}")
             print(f"{'='*60}\n")
             
-            for i, board in enumerate(boards):
-                # Check stop flag before each board
-                if self.stop_flag_ref and self.stop_flag_ref.stop_requested:
-                    print(f"Healthcare automation stopped by user at board {i+1}")
-                    break
-                
-                board_id = board.get('id')
-                board_name = board.get('site_name')
-                
-                # Skip if already completed in this session
-                if board_id in self.completed_boards:
-                    print(f"Skipping board {board_name} (ID: {board_id}) - already completed")
-                    continue
-                
-                print(f"\n{'='*40}")
-                print(f"Board {i+1}/{len(boards)}: {board_name}")
-                print(f"ID: {board_id}")
-                print(f"URL: {board.get('site_url', 'No URL')}")
-                print(f"Agency: {board.get('agency_name', 'No Agency')}")
-                print(f"Automation Script: {board.get('automation_script', 'Not specified')}")
-                print(f"{'='*40}\n")
-                
-                try:
-                    # Call the specific website automation
-                    result = self._call_website_automation(board, user_profile)
-                    results[board_name] = result
+            # Drop boards already completed in this session up front
+            pending = [b for b in boards if b.get('id') not in self.completed_boards]
+            if len(pending) < len(boards):
+                print(f"Skipping {len(boards) - len(pending)} board(s) already completed")
+            
+            # Boards are independent sites, so submit to several at once;
+            # each automation drives its own browser
+            workers = max(1, min(int(os.getenv('JOB_BOARD_WORKERS', '4')), len(pending)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._process_board, board, user_profile, i + 1, len(pending)): board
+                    for i, board in enumerate(pending)
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is None:
+                        continue  # Stopped before this board started
                     
+                    results[futures[future].get('site_name')] = result
                     if result.get('success'):
                         successful_submissions += 1
-                        self.completed_boards.add(board_id)  # Mark as completed
-                        print(f"✅ Successfully submitted to {board_name}")
-                    else:
-                        print(f"❌ Failed to submit to {board_name}: {result.get('message', 'Unknown error')}")
-                    
-                    # Wait between boards if not stopped
-                    if not (self.stop_flag_ref and self.stop_flag_ref.stop_requested) and i < len(boards) - 1:
-                        wait_time = 5
-                        print(f"\nWaiting {wait_time} seconds before next board...")
-                        for s in range(wait_time):
-                            if self.stop_flag_ref and self.stop_flag_ref.stop_requested:
-                                break
-                            time.sleep(1)
-                            if s % 10 == 0:
-                                print(f"  {wait_time - s} seconds remaining...")
-                
-                except Exception as e:
-                    print(f"❌ Error with board {board_name}: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    results[board_name] = {'success': False, 'message': str(e)}
+            
+            if is_stopped():
+                print(f"Healthcare automation stopped by user")
             
             print(f"\n{'='*60}")
             print(f"Healthcare AUTOMATION COMPLETE")
@@ -202,6 +199,42 @@ class HealthcareAssistant:
             import traceback
             traceback.print_exc()
     
+    def _process_board(self, board, user_profile, position, total):
+        """Submit to one board on a worker thread; returns its result, or None if stopped first"""
+        if self._is_stopped():
+            return None
+        
+        board_id = board.get('id')
+        board_name = board.get('site_name')
+        
+        # One print per header so concurrent boards don't interleave it
+        print(
+            f"\n{'='*40}\n"
+            f"Board {position}/{total}: {board_name}\n"
+            f"ID: {board_id}\n"
+            f"URL: {board.get('site_url', 'No URL')}\n"
+            f"Agency: {board.get('agency_name', 'No Agency')}\n"
+            f"Automation Script: {board.get('automation_script', 'Not specified')}\n"
+            f"{'='*40}\n"
+        )
+        
+        try:
+            # Call the specific website automation
+            result = self._call_website_automation(board, user_profile)
+            
+            if result.get('success'):
+                self.completed_boards.add(board_id)  # Mark as completed
+                print(f"✅ Successfully submitted to {board_name}")
+            else:
+                print(f"❌ Failed to submit to {board_name}: {result.get('message', 'Unknown error')}")
+            return result
+        
+        except Exception as e:
+            print(f"❌ Error with board {board_name}: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return {'success': False, 'message': str(e)}
+    
     def _call_website_automation(self, board, user_profile):
         """Call the specific website automation based on site name"""
         try:
@@ -219,15 +252,10 @@ class HealthcareAssistant:
                         'message': f'No automation found for site: {site_name}. Available automations: {list(self.automation_modules.keys())}'
                     }
             
-            module_name, class_name = self.automation_modules[site_name]
+            # Automation class, imported once by _load_automation_modules
+            automation_class = self.automation_modules[site_name]
             
             try:
-                # Import the module
-                module = importlib.import_module(module_name)
-                
-                # Get the automation class
-                automation_class = getattr(module, class_name)
-                
                 # Instantiate and run
                 automation = automation_class()
                 
@@ -235,7 +263,7 @@ class HealthcareAssistant:
                 success, message = automation.submit_application(
                     job_board=board,
                     user_profile=user_profile,
-                    stop_check_callback=lambda: self.stop_flag_ref and self.stop_flag_ref.stop_requested
+                    stop_check_callback=self._is_stopped
                 )
                 
                 return {'success': success, 'message': message}
@@ -886,7 +886,7 @@ def stop_job_board_assistant():
     if not job_assistant:
         return jsonify({'status': 'error', 'message': 'Job Board Assistant not available'}), 500
     
-    return job_assistant.stop_automation()
+    return job_assistant.stop_automation(request.form.get('submission_id'), session.get('user_email'))
 
 # ============================================================================
 # MAIN APPLICATION